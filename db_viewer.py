@@ -1,21 +1,283 @@
+import os
 import sqlite3
+from contextlib import AbstractContextManager
 import json
 from datetime import datetime
+from functools import lru_cache, update_wrapper
 from urllib.parse import urlparse
-from typing import Dict, List, Any
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 import click
 
-class DatabaseViewer:
+try:
+    import orjson
+except ImportError:  # optional, falls back to the stdlib encoder
+    orjson = None
+
+
+def _dumps(value: Any) -> bytes:
+    """Encode a value as indented UTF-8 JSON, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _require_zstandard():
+    """Import zstandard on first use, so only compressed exports need it"""
+    try:
+        import zstandard
+    except ImportError:
+        raise RuntimeError("Compressed exports need the zstandard package: pip install zstandard") from None
+    return zstandard
+
+
+def load_from_json(filename: str) -> Dict[str, Any]:
+    """Load an export written by ``export_to_json`` (plain or ``.zst``)"""
+    with open(filename, 'rb') as f:
+        if filename.endswith('.zst'):
+            data = _require_zstandard().ZstdDecompressor().stream_reader(f).read()
+        else:
+            data = f.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+@lru_cache(maxsize=4096)
+def _bare_netloc(url: str) -> str:
+    """Host part of a source URL, empty if it has none"""
+    return urlparse(url).netloc
+
+def _netloc(url: str) -> str:
+    """Domain of a source URL (the URL itself if it has none)"""
+    return _bare_netloc(url) or url
+
+# snippet() marks matches with control characters that never occur in article
+# text, so a marker reliably means the column matched; they are shown as [term]
+_MATCH_OPEN = '\x02'
+_MATCH_MARKS = str.maketrans({_MATCH_OPEN: '[', '\x03': ']'})
+
+# Hot queries, kept together as module constants so they are written once
+_ARTICLE_BY_ID_SQL = "SELECT * FROM articles WHERE id = ?"
+_SEARCH_FTS_SQL = """
+    SELECT a.id, a.title, a.author, a.source_url, a.created_at,
+           snippet(articles_fts, 2, char(2), char(3), '…', 12) as content_snippet,
+           snippet(articles_fts, 3, char(2), char(3), '…', 12) as summary_snippet,
+           f.rank as rank
+    FROM articles_fts f
+    JOIN articles a ON a.id = f.rowid
+    WHERE articles_fts MATCH ?
+    ORDER BY f.rank, a.id
+    LIMIT ?
+"""
+# Keyset continuation: rank is bm25(), so the next page starts after (rank, id)
+_SEARCH_FTS_AFTER_SQL = _SEARCH_FTS_SQL.replace(
+    "WHERE articles_fts MATCH ?", "WHERE articles_fts MATCH ? AND (f.rank, a.id) > (?, ?)")
+_ALL_ARTICLES_DETAILED_SQL = """
+    SELECT id, title, author, content, summary, source_url, created_at,
+           LENGTH(content) as content_length, LENGTH(summary) as summary_length
+    FROM articles 
+    ORDER BY created_at DESC
+"""
+_ALL_ARTICLES_LIST_SQL = """
+    SELECT id, title, author, created_at,
+           LENGTH(content) as content_length, LENGTH(summary) as summary_length, source_url
+    FROM articles 
+    ORDER BY created_at DESC
+"""
+
+# Analysis report layout; the *_block fields are pre-joined lines, each
+# ending in a newline, and the optional sections are rendered separately
+_REPORT_TMPL = """\
+{sep}
+ARTICLE DATABASE ANALYSIS REPORT
+{sep}
+Generated: {now}
+Database: {db_path}
+
+📊 BASIC STATISTICS
+{rule}
+Total Articles: {total_rows}
+Total Summaries: {total_summaries}
+Summary Coverage: {coverage:.1f}%
+
+📝 CONTENT ANALYSIS
+{rule}
+Average Content Length: {avg_length:.0f} characters
+Shortest Article: {min_length} characters
+Longest Article: {max_length} characters
+
+{summary_section}🌐 SOURCE DISTRIBUTION
+{rule}
+{sources_block}
+{authors_section}📅 RECENT ACTIVITY
+{rule}
+{timeline_block}
+{sep}"""
+
+_REPORT_SUMMARY_TMPL = """\
+📋 SUMMARY ANALYSIS
+{rule}
+Average Summary Length: {avg_summary_length:.0f} characters
+Shortest Summary: {min_summary_length} characters
+Longest Summary: {max_summary_length} characters
+
+"""
+
+_REPORT_AUTHORS_TMPL = """\
+✍️  TOP AUTHORS
+{rule}
+{authors_block}
+"""
+
+class DatabaseViewer(AbstractContextManager):
     """Interactive database viewer with analysis capabilities"""
     
     def __init__(self, db_path: str = "articles.db"):
         self.db_path = db_path
-        self.conn = sqlite3.connect(db_path)
+        self.conn = sqlite3.connect(db_path, cached_statements=256, isolation_level=None)
         self.conn.row_factory = sqlite3.Row  # Enable column access by name
+        self._configure_connection()
+        self._init_schema()
     
-    def __del__(self):
-        if hasattr(self, 'conn'):
+    def close(self):
+        """Refresh planner statistics and close the connection"""
+        if self.conn is None:
+            return
+        try:
+            self.conn.execute("PRAGMA optimize")
+        finally:
             self.conn.close()
+            self.conn = None
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def _configure_connection(self):
+        """Tune the connection for read-heavy analysis (overridable via env vars)"""
+        cursor = self.conn.cursor()
+        
+        # page_size only takes effect on a fresh database, before WAL is enabled
+        cursor.execute("PRAGMA page_count")
+        if cursor.fetchone()[0] == 0:
+            cursor.execute(f"PRAGMA page_size={int(os.getenv('SQLITE_PAGE_SIZE', 8192))}")
+        
+        journal_mode = os.getenv('SQLITE_JOURNAL_MODE', 'WAL')
+        if not journal_mode.isalpha():
+            raise ValueError(f"Invalid SQLITE_JOURNAL_MODE: {journal_mode}")
+        try:
+            cursor.execute(f"PRAGMA journal_mode={journal_mode}")
+        except sqlite3.OperationalError as e:
+            # Switching the journal mode writes the header; keep a read-only one as is
+            if 'readonly' not in str(e):
+                raise
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute(f"PRAGMA mmap_size={int(os.getenv('SQLITE_MMAP_SIZE', 268435456))}")
+        cursor.execute(f"PRAGMA cache_size={int(os.getenv('SQLITE_CACHE_SIZE', -65536))}")
+        
+        self.conn.create_function("netloc", 1, _netloc, deterministic=True)
+    
+    def _init_schema(self):
+        """Create the indexes used by the viewer's search and analysis queries
+        
+        The articles table itself is never altered. On a read-only database the
+        indexes are skipped and searches fall back to plain LIKE scans.
+        """
+        self.has_fts = False
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'articles'")
+        if not cursor.fetchone():
+            return
+        
+        try:
+            self._create_indexes()
+        except sqlite3.OperationalError as e:
+            if 'readonly' not in str(e):
+                raise
+        
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'articles_fts'")
+        self.has_fts = cursor.fetchone() is not None
+    
+    def _create_indexes(self):
+        """Create the NOCASE, timeline, author and full-text indexes"""
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM sqlite_master WHERE type = 'index' AND tbl_name = 'articles'")
+        index_count = cursor.fetchone()[0]
+        
+        # NOCASE indexes let case-insensitive prefix LIKE / equality become range probes
+        cursor.executescript("""
+            CREATE INDEX IF NOT EXISTS idx_articles_title_nocase ON articles(title COLLATE NOCASE);
+            CREATE INDEX IF NOT EXISTS idx_articles_author_nocase ON articles(author COLLATE NOCASE);
+            CREATE INDEX IF NOT EXISTS idx_articles_source_url_nocase ON articles(source_url COLLATE NOCASE);
+        """)
+        
+        # Indexed day bucket so the timeline groups by walking the index; the
+        # timeline query must spell the expression exactly like this
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_articles_created_date
+            ON articles(substr(created_at, 1, 10))
+        """)
+        
+        # Partial index skipping empty authors: the author distribution is
+        # answered from this index alone
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_articles_author_nonempty ON articles(author)
+            WHERE author IS NOT NULL AND author != ''
+        """)
+        self._init_search_index()
+        
+        # Gather planner statistics once the new indexes exist
+        cursor.execute("SELECT COUNT(*) FROM sqlite_master WHERE type = 'index' AND tbl_name = 'articles'")
+        if cursor.fetchone()[0] != index_count:
+            cursor.execute("ANALYZE")
+    
+    def _init_search_index(self):
+        """Create the FTS5 index mirroring the articles table and keep it in sync"""
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'articles_fts'")
+        existing = cursor.fetchone() is not None
+        
+        cursor.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+                title, author, content, summary,
+                content='articles', content_rowid='id'
+            )
+        """)
+        cursor.executescript("""
+            CREATE TRIGGER IF NOT EXISTS articles_fts_ai AFTER INSERT ON articles BEGIN
+                INSERT INTO articles_fts(rowid, title, author, content, summary)
+                VALUES (new.id, new.title, new.author, new.content, new.summary);
+            END;
+            CREATE TRIGGER IF NOT EXISTS articles_fts_ad AFTER DELETE ON articles BEGIN
+                INSERT INTO articles_fts(articles_fts, rowid, title, author, content, summary)
+                VALUES ('delete', old.id, old.title, old.author, old.content, old.summary);
+            END;
+            CREATE TRIGGER IF NOT EXISTS articles_fts_au AFTER UPDATE ON articles BEGIN
+                INSERT INTO articles_fts(articles_fts, rowid, title, author, content, summary)
+                VALUES ('delete', old.id, old.title, old.author, old.content, old.summary);
+                INSERT INTO articles_fts(rowid, title, author, content, summary)
+                VALUES (new.id, new.title, new.author, new.content, new.summary);
+            END;
+        """)
+        
+        # One-shot migration: index rows that existed before the FTS table
+        if not existing:
+            cursor.execute("""
+                INSERT INTO articles_fts(rowid, title, author, content, summary)
+                SELECT id, title, author, content, summary FROM articles
+            """)
+    
+    @staticmethod
+    def _build_match_query(query: str, field: str = 'all') -> str:
+        """Translate a user query into an FTS5 MATCH expression"""
+        # Quote every token so FTS5 operators/punctuation are treated literally,
+        # and prefix-match each one to stay close to the old substring search
+        tokens = ['"' + token.replace('"', '""') + '"*' for token in query.split()]
+        if not tokens:
+            return ''
+        
+        expression = ' '.join(tokens)
+        if field != 'all':
+            expression = f"{field} : ({expression})"
+        return expression
     
     def get_table_info(self) -> Dict[str, Any]:
         """Get information about the articles table"""
@@ -31,81 +293,95 @@ class DatabaseViewer:
             'total_rows': total_rows
         }
     
-    def get_all_articles_detailed(self) -> List[Dict[str, Any]]:
-        """Get all articles with detailed information"""
+    def _iter_article_rows(self):
+        """Column names plus a cursor yielding plain tuples for every article"""
         cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT id, title, author, content, summary, source_url, created_at,
-                   LENGTH(content) as content_length,
-                   LENGTH(summary) as summary_length
-            FROM articles 
-            ORDER BY created_at DESC
-        """)
-        
-        articles = []
-        for row in cursor.fetchall():
-            articles.append(dict(row))
-        
-        return articles
+        cursor.row_factory = None  # raw tuples, no per-row sqlite3.Row
+        cursor.execute(_ALL_ARTICLES_DETAILED_SQL)
+        keys = tuple(col[0] for col in cursor.description)
+        return keys, cursor
+    
+    def get_all_articles_list(self) -> Iterator[Dict[str, Any]]:
+        """Stream article metadata and lengths, without content or summary"""
+        cursor = self.conn.cursor()
+        cursor.execute(_ALL_ARTICLES_LIST_SQL)
+        for row in cursor:
+            yield dict(row)
+    
+    def get_all_articles_detailed(self) -> Iterator[Dict[str, Any]]:
+        """Stream all articles with full content, one row at a time (used by export)"""
+        keys, rows = self._iter_article_rows()
+        for row in rows:
+            yield dict(zip(keys, row))
     
     def get_content_analysis(self) -> Dict[str, Any]:
         """Analyze content patterns and statistics"""
         cursor = self.conn.cursor()
         
-        # Content length distribution
+        # Read the heavy content/summary columns once into a small temp table;
+        # every statistic below is computed from it
+        cursor.execute("DROP TABLE IF EXISTS temp.article_stats")
         cursor.execute("""
+            CREATE TEMP TABLE article_stats AS
             SELECT 
-                MIN(LENGTH(content)) as min_length,
-                MAX(LENGTH(content)) as max_length,
-                AVG(LENGTH(content)) as avg_length,
-                COUNT(*) as total_articles
+                LENGTH(content) as content_length,
+                CASE WHEN summary IS NOT NULL AND summary != '' THEN LENGTH(summary) END as summary_length,
+                source_url
             FROM articles
         """)
-        content_stats = dict(cursor.fetchone())
-        
-        # Summary statistics
-        cursor.execute("""
-            SELECT 
-                COUNT(*) as total_summaries,
-                AVG(LENGTH(summary)) as avg_summary_length,
-                MIN(LENGTH(summary)) as min_summary_length,
-                MAX(LENGTH(summary)) as max_summary_length
-            FROM articles 
-            WHERE summary IS NOT NULL AND summary != ''
-        """)
-        summary_stats = dict(cursor.fetchone())
-        
-        # Source distribution
-        cursor.execute("""
-            SELECT source_url, COUNT(*) as count
-            FROM articles 
-            GROUP BY source_url 
-            ORDER BY count DESC
-        """)
-        source_distribution = [dict(row) for row in cursor.fetchall()]
         
-        # Author distribution
-        cursor.execute("""
-            SELECT author, COUNT(*) as count
-            FROM articles 
-            WHERE author IS NOT NULL AND author != ''
-            GROUP BY author 
-            ORDER BY count DESC
-            LIMIT 20
-        """)
-        author_distribution = [dict(row) for row in cursor.fetchall()]
-        
-        # Timeline analysis
-        cursor.execute("""
-            SELECT 
-                DATE(created_at) as date,
-                COUNT(*) as articles_count
-            FROM articles 
-            GROUP BY DATE(created_at)
-            ORDER BY date DESC
-            LIMIT 30
-        """)
-        timeline = [dict(row) for row in cursor.fetchall()]
+        try:
+            # Content and summary length distribution
+            cursor.execute("""
+                SELECT 
+                    MIN(content_length) as min_length,
+                    MAX(content_length) as max_length,
+                    AVG(content_length) as avg_length,
+                    COUNT(*) as total_articles,
+                    COUNT(summary_length) as total_summaries,
+                    AVG(summary_length) as avg_summary_length,
+                    MIN(summary_length) as min_summary_length,
+                    MAX(summary_length) as max_summary_length
+                FROM article_stats
+            """)
+            stats = dict(cursor.fetchone())
+            content_stats = {key: stats[key] for key in ('min_length', 'max_length', 'avg_length', 'total_articles')}
+            summary_stats = {key: stats[key] for key in ('total_summaries', 'avg_summary_length',
+                                                         'min_summary_length', 'max_summary_length')}
+            
+            # Source distribution by domain
+            cursor.execute("""
+                SELECT netloc(source_url) as domain, COUNT(*) as count
+                FROM article_stats 
+                GROUP BY domain 
+                ORDER BY count DESC
+            """)
+            source_distribution = [dict(row) for row in cursor.fetchall()]
+            
+            # Author distribution
+            cursor.execute("""
+                SELECT author, COUNT(*) as count
+                FROM articles 
+                WHERE author IS NOT NULL AND author != ''
+                GROUP BY author 
+                ORDER BY count DESC
+                LIMIT 20
+            """)
+            author_distribution = [dict(row) for row in cursor.fetchall()]
+            
+            # Timeline analysis
+            cursor.execute("""
+                SELECT 
+                    substr(created_at, 1, 10) as date,
+                    COUNT(*) as articles_count
+                FROM articles 
+                GROUP BY substr(created_at, 1, 10)
+                ORDER BY substr(created_at, 1, 10) DESC
+                LIMIT 30
+            """)
+            timeline = [dict(row) for row in cursor.fetchall()]
+        finally:
+            cursor.execute("DROP TABLE IF EXISTS temp.article_stats")
         
         return {
             'content_stats': content_stats,
@@ -115,167 +391,284 @@ class DatabaseViewer:
             'timeline': timeline
         }
     
-    def search_articles(self, query: str, field: str = 'all') -> List[Dict[str, Any]]:
-        """Search articles in specific fields"""
+    def search_articles(self, query: str, field: str = 'all', mode: str = 'contains',
+                        limit: int = 50, after: Optional[Tuple] = None
+                        ) -> Tuple[List[Dict[str, Any]], Optional[Tuple]]:
+        """Search articles in specific fields, one page at a time
+        
+        ``contains`` uses the FTS5 index (a LIKE scan when the database is
+        read-only and has none); ``prefix`` and ``exact`` compare the whole
+        column case-insensitively so the NOCASE indexes can be used.
+        Rows carry ``content_snippet``/``summary_snippet`` built by SQLite
+        rather than the full content; a snippet is ``None`` when that column
+        did not match.
+        
+        Returns ``(rows, next_cursor)``; pass ``next_cursor`` back as ``after``
+        to fetch the following page. It is ``None`` on the last page.
+        """
+        if field not in ('all', 'title', 'author', 'content', 'summary'):
+            raise ValueError(f"Invalid field: {field}")
+        if mode not in ('contains', 'prefix', 'exact'):
+            raise ValueError(f"Invalid mode: {mode}")
+        
+        if mode != 'contains' or not self.has_fts:
+            return self._search_columns(query, field, mode, limit, after)
+        
+        match = self._build_match_query(query, field)
+        if not match:
+            return [], None
+        
+        # Fetch one extra row to know whether another page exists
         cursor = self.conn.cursor()
+        if after:
+            cursor.execute(_SEARCH_FTS_AFTER_SQL, (match, *after, limit + 1))
+        else:
+            cursor.execute(_SEARCH_FTS_SQL, (match, limit + 1))
+        rows = [dict(row) for row in cursor.fetchmany(limit + 1)]
+        
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = (rows[-1]['rank'], rows[-1]['id'])
+        for row in rows:
+            del row['rank']
+            # Without a marker the snippet is just the column's first words
+            for key in ('content_snippet', 'summary_snippet'):
+                snippet = row[key]
+                row[key] = snippet.translate(_MATCH_MARKS) if snippet and _MATCH_OPEN in snippet else None
+        return rows, next_cursor
+    
+    def _search_columns(self, query: str, field: str, mode: str, limit: int,
+                        after: Optional[Tuple]) -> Tuple[List[Dict[str, Any]], Optional[Tuple]]:
+        """Prefix/exact search that SQLite can answer from the NOCASE indexes
+        (and the LIKE scan used for ``contains`` without an FTS index)"""
+        columns = ['title', 'author', 'content', 'summary'] if field == 'all' else [field]
         
-        if field == 'all':
-            sql = """
-                SELECT * FROM articles 
-                WHERE title LIKE ? OR author LIKE ? OR content LIKE ? OR summary LIKE ?
-                ORDER BY created_at DESC
-            """
-            params = [f'%{query}%'] * 4
-        elif field == 'title':
-            sql = "SELECT * FROM articles WHERE title LIKE ? ORDER BY created_at DESC"
-            params = [f'%{query}%']
-        elif field == 'author':
-            sql = "SELECT * FROM articles WHERE author LIKE ? ORDER BY created_at DESC"
-            params = [f'%{query}%']
-        elif field == 'content':
-            sql = "SELECT * FROM articles WHERE content LIKE ? ORDER BY created_at DESC"
-            params = [f'%{query}%']
-        elif field == 'summary':
-            sql = "SELECT * FROM articles WHERE summary LIKE ? ORDER BY created_at DESC"
-            params = [f'%{query}%']
+        if mode != 'exact':
+            escaped = query.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+            condition = "{} LIKE ? ESCAPE '\\'"
+            param = f'{escaped}%' if mode == 'prefix' else f'%{escaped}%'
         else:
-            raise ValueError(f"Invalid field: {field}")
+            condition = "{} = ? COLLATE NOCASE"
+            param = query
+        
+        # Snippets are only produced for the columns that actually matched
+        content_snippet = "NULL"
+        summary_snippet = "NULL"
+        select_params = []
+        if 'content' in columns:
+            content_snippet = (f"CASE WHEN {condition.format('content')} THEN substr(content, 1, 150) || "
+                               f"CASE WHEN LENGTH(content) > 150 THEN '…' ELSE '' END END")
+            select_params.append(param)
+        if 'summary' in columns:
+            summary_snippet = f"CASE WHEN {condition.format('summary')} THEN summary END"
+            select_params.append(param)
+        
+        select = f"""
+            SELECT id, title, author, source_url, created_at,
+                   {content_snippet} as content_snippet,
+                   {summary_snippet} as summary_snippet
+            FROM articles
+        """
+        keyset = " AND (created_at, id) < (?, ?)" if after else ""
+        
+        # An OR across columns forces a full scan, so each indexed column gets
+        # its own UNION arm (an index probe); the unindexed text columns share
+        # one arm so they cost at most a single scan
+        arms = [[column] for column in columns if column in ('title', 'author')]
+        unindexed = [column for column in columns if column not in ('title', 'author')]
+        if unindexed:
+            arms.append(unindexed)
         
-        cursor.execute(sql, params)
-        return [dict(row) for row in cursor.fetchall()]
+        sql_arms = []
+        params = []
+        for arm in arms:
+            where = ' OR '.join(condition.format(column) for column in arm)
+            sql_arms.append(f"{select} WHERE ({where}){keyset}")
+            params.extend(select_params)
+            params.extend([param] * len(arm))
+            if after:
+                params.extend(after)
+        params.append(limit + 1)
+        
+        cursor = self.conn.cursor()
+        cursor.execute(f"""
+            SELECT * FROM ({' UNION '.join(sql_arms)})
+            ORDER BY created_at DESC, id DESC
+            LIMIT ?
+        """, params)
+        rows = [dict(row) for row in cursor.fetchall()]
+        
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = (rows[-1]['created_at'], rows[-1]['id'])
+        return rows, next_cursor
     
     def get_article_by_id(self, article_id: int) -> Dict[str, Any]:
         """Get a specific article by ID"""
         cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM articles WHERE id = ?", (article_id,))
+        cursor.execute(_ARTICLE_BY_ID_SQL, (article_id,))
         row = cursor.fetchone()
         return dict(row) if row else None
     
-    def export_to_json(self, filename: str = None) -> str:
-        """Export all data to JSON file"""
+    def export_to_json(self, filename: str = None, compress: bool = False) -> str:
+        """Export all data to JSON file, zstd-compressed when ``compress`` is set
+        or the filename ends in ``.zst``"""
         if not filename:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"articles_export_{timestamp}.json"
-        
-        articles = self.get_all_articles_detailed()
-        analysis = self.get_content_analysis()
-        table_info = self.get_table_info()
+        if compress and not filename.endswith('.zst'):
+            filename += '.zst'
+        compress = filename.endswith('.zst')
         
         export_data = {
             'export_date': datetime.now().isoformat(),
-            'table_info': table_info,
-            'analysis': analysis,
-            'articles': articles
+            'table_info': self.get_table_info(),
+            'analysis': self.get_content_analysis(),
         }
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False)
+        # The query runs (and can fail) before the file is created, and the
+        # zstd frame is finished before the file is closed
+        cctx = _require_zstandard().ZstdCompressor(level=3, threads=-1) if compress else None
+        keys, rows = self._iter_article_rows()
+        with open(filename, 'wb') as f:
+            try:
+                if cctx is not None:
+                    with cctx.stream_writer(f, closefd=False) as writer:
+                        self._write_export(writer, export_data, keys, rows)
+                else:
+                    self._write_export(f, export_data, keys, rows)
+            except BaseException:
+                # Never leave an empty or truncated export behind
+                f.close()
+                os.remove(filename)
+                raise
         
         return filename
     
+    @staticmethod
+    def _write_export(f, export_data: Dict[str, Any], keys: Tuple[str, ...], rows) -> None:
+        """Write the export JSON: export_data's sections, then the article rows"""
+        def dumps(value, depth: int) -> bytes:
+            # Each value is encoded on its own and re-indented to its nesting
+            # depth, so the file matches a single indent=2 dump
+            return _dumps(value).replace(b'\n', b'\n' + b'  ' * depth)
+        
+        f.write(b'{\n')
+        for key, value in export_data.items():
+            f.write(b'  ' + _dumps(key) + b': ' + dumps(value, 1) + b',\n')
+        
+        # Articles are encoded in blocks of rows as they are read, so the
+        # export never holds the whole table in memory and the encoder runs
+        # once per block rather than once per article
+        f.write(b'  "articles": [')
+        first = True
+        while True:
+            block = rows.fetchmany(1024)
+            if not block:
+                break
+            blob = dumps([dict(zip(keys, row)) for row in block], 1)
+            # Drop the block's own brackets: "[" ... "\n  ]"
+            f.write((b'' if first else b',') + blob[1:blob.rindex(b'\n')])
+            first = False
+        f.write(b']\n}' if first else b'\n  ]\n}')
+    
     def generate_report(self) -> str:
         """Generate a comprehensive text report"""
         analysis = self.get_content_analysis()
         table_info = self.get_table_info()
-        
-        report = []
-        report.append("=" * 60)
-        report.append("ARTICLE DATABASE ANALYSIS REPORT")
-        report.append("=" * 60)
-        report.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        report.append(f"Database: {self.db_path}")
-        report.append("")
-        
-        # Basic Stats
-        report.append("📊 BASIC STATISTICS")
-        report.append("-" * 30)
-        report.append(f"Total Articles: {table_info['total_rows']}")
-        report.append(f"Total Summaries: {analysis['summary_stats']['total_summaries']}")
-        report.append(f"Summary Coverage: {(analysis['summary_stats']['total_summaries']/table_info['total_rows']*100):.1f}%")
-        report.append("")
-        
-        # Content Analysis
-        report.append("📝 CONTENT ANALYSIS")
-        report.append("-" * 30)
         content_stats = analysis['content_stats']
-        report.append(f"Average Content Length: {content_stats['avg_length']:.0f} characters")
-        report.append(f"Shortest Article: {content_stats['min_length']} characters")
-        report.append(f"Longest Article: {content_stats['max_length']} characters")
-        report.append("")
-        
-        # Summary Analysis
-        if analysis['summary_stats']['total_summaries'] > 0:
-            report.append("📋 SUMMARY ANALYSIS")
-            report.append("-" * 30)
-            summary_stats = analysis['summary_stats']
-            report.append(f"Average Summary Length: {summary_stats['avg_summary_length']:.0f} characters")
-            report.append(f"Shortest Summary: {summary_stats['min_summary_length']} characters")
-            report.append(f"Longest Summary: {summary_stats['max_summary_length']} characters")
-            report.append("")
-        
-        # Source Distribution
-        report.append("🌐 SOURCE DISTRIBUTION")
-        report.append("-" * 30)
-        for source in analysis['source_distribution'][:10]:
-            domain = urlparse(source['source_url']).netloc or source['source_url']
-            report.append(f"{domain}: {source['count']} articles")
-        report.append("")
-        
-        # Top Authors
+        summary_stats = analysis['summary_stats']
+        
+        summary_section = ''
+        if summary_stats['total_summaries'] > 0:
+            summary_section = _REPORT_SUMMARY_TMPL.format_map({'rule': '-' * 30, **summary_stats})
+        
+        authors_section = ''
         if analysis['author_distribution']:
-            report.append("✍️  TOP AUTHORS")
-            report.append("-" * 30)
-            for author in analysis['author_distribution'][:10]:
-                report.append(f"{author['author']}: {author['count']} articles")
-            report.append("")
-        
-        # Recent Activity
-        report.append("📅 RECENT ACTIVITY")
-        report.append("-" * 30)
-        for day in analysis['timeline'][:7]:
-            report.append(f"{day['date']}: {day['articles_count']} articles")
-        
-        report.append("")
-        report.append("=" * 60)
-        
-        return "\n".join(report)
+            authors_section = _REPORT_AUTHORS_TMPL.format_map({
+                'rule': '-' * 30,
+                'authors_block': ''.join(f"{author['author']}: {author['count']} articles\n"
+                                         for author in analysis['author_distribution'][:10]),
+            })
+        
+        return _REPORT_TMPL.format_map({
+            'sep': '=' * 60,
+            'rule': '-' * 30,
+            'now': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'db_path': self.db_path,
+            'total_rows': table_info['total_rows'],
+            'total_summaries': summary_stats['total_summaries'],
+            'coverage': summary_stats['total_summaries'] / table_info['total_rows'] * 100,
+            'avg_length': content_stats['avg_length'],
+            'min_length': content_stats['min_length'],
+            'max_length': content_stats['max_length'],
+            'summary_section': summary_section,
+            'sources_block': ''.join(f"{source['domain']}: {source['count']} articles\n"
+                                     for source in analysis['source_distribution'][:10]),
+            'authors_section': authors_section,
+            'timeline_block': ''.join(f"{day['date']}: {day['articles_count']} articles\n"
+                                      for day in analysis['timeline'][:7]),
+        })
 
 # CLI for the database viewer
+def pass_viewer(f):
+    """Like click.pass_obj, passing the DatabaseViewer shared by the whole
+    invocation (one connection / statement cache). It is only opened once a
+    command actually runs, so --help never touches the database. The command
+    also accepts --db-path itself, as it did before the group option existed."""
+    def new_func(*args, db_path=None, **kwargs):
+        ctx = click.get_current_context()
+        root = ctx.find_root()
+        viewer = root.meta.get('db_viewer.viewer')
+        if viewer is None:
+            viewer = root.with_resource(DatabaseViewer(db_path or root.meta['db_viewer.db_path']))
+            root.meta['db_viewer.viewer'] = viewer
+        return ctx.invoke(f, viewer, *args, **kwargs)
+    new_func = update_wrapper(new_func, f)
+    return click.option('--db-path', default=None, help='Path to database file (overrides the group option)')(new_func)
+
 @click.group()
-def viewer_cli():
+@click.option('--db-path', default='articles.db', help='Path to database file')
+@click.pass_context
+def viewer_cli(ctx, db_path):
     """Database Viewer CLI"""
-    pass
+    ctx.meta['db_viewer.db_path'] = db_path
 
 @viewer_cli.command()
-@click.option('--db-path', default='articles.db', help='Path to database file')
-def show_all(db_path):
+@pass_viewer
+def show_all(viewer):
     """Show all articles in a formatted table"""
-    viewer = DatabaseViewer(db_path)
-    articles = viewer.get_all_articles_detailed()
+    total = viewer.get_table_info()['total_rows']
     
-    if not articles:
+    if not total:
         click.echo("No articles found in database")
         return
     
-    click.echo(f"\n📚 All Articles ({len(articles)} total)")
-    click.echo("=" * 100)
+    # Output is buffered per page and written with a single echo
+    buf = [f"\n📚 All Articles ({total} total)", "=" * 100]
     
-    for i, article in enumerate(articles, 1):
-        click.echo(f"\n#{article['id']} | {article['title'][:60]}{'...' if len(article['title']) > 60 else ''}")
-        click.echo(f"Author: {article['author'] or 'Unknown'} | Created: {article['created_at']}")
-        click.echo(f"Content: {article['content_length']} chars | Summary: {article['summary_length'] or 0} chars")
-        click.echo(f"Source: {urlparse(article['source_url']).netloc}")
-        
-        if i % 5 == 0 and i < len(articles):
-            if not click.confirm(f"\nContinue showing articles? ({len(articles) - i} remaining)"):
+    for i, article in enumerate(viewer.get_all_articles_list(), 1):
+        buf.append(f"\n#{article['id']} | {article['title'][:60]}{'...' if len(article['title']) > 60 else ''}")
+        buf.append(f"Author: {article['author'] or 'Unknown'} | Created: {article['created_at']}")
+        buf.append(f"Content: {article['content_length']} chars | Summary: {article['summary_length'] or 0} chars")
+        buf.append(f"Source: {_bare_netloc(article['source_url'])}")
+        
+        if i % 5 == 0 and i < total:
+            click.echo("\n".join(buf))
+            buf.clear()
+            if not click.confirm(f"\nContinue showing articles? ({total - i} remaining)"):
                 break
+    
+    if buf:
+        click.echo("\n".join(buf))
 
 @viewer_cli.command()
 @click.argument('article_id', type=int)
-@click.option('--db-path', default='articles.db', help='Path to database file')
-def show_article(article_id, db_path):
+@pass_viewer
+def show_article(viewer, article_id):
     """Show detailed view of a specific article"""
-    viewer = DatabaseViewer(db_path)
     article = viewer.get_article_by_id(article_id)
     
     if not article:
@@ -301,53 +694,58 @@ def show_article(article_id, db_path):
         click.echo(article['summary'])
 
 @viewer_cli.command()
-@click.option('--db-path', default='articles.db', help='Path to database file')
-def analyze(db_path):
+@pass_viewer
+def analyze(viewer):
     """Show comprehensive database analysis"""
-    viewer = DatabaseViewer(db_path)
     report = viewer.generate_report()
     click.echo(report)
 
 @viewer_cli.command()
 @click.argument('query')
 @click.option('--field', default='all', help='Field to search in (all, title, author, content, summary)')
-@click.option('--db-path', default='articles.db', help='Path to database file')
-def search(query, field, db_path):
+@click.option('--mode', default='contains', type=click.Choice(['contains', 'prefix', 'exact']),
+              help='Match words anywhere (full-text), a prefix of the field, or the exact field value')
+@click.option('--page-size', default=20, type=click.IntRange(min=1), help='Results shown per page')
+@pass_viewer
+def search(viewer, query, field, mode, page_size):
     """Search articles"""
-    viewer = DatabaseViewer(db_path)
-    results = viewer.search_articles(query, field)
+    results, next_cursor = viewer.search_articles(query, field, mode, limit=page_size)
     
     if not results:
         click.echo(f"No articles found matching '{query}' in {field}")
         return
     
-    click.echo(f"\n🔍 Search Results for '{query}' in {field} ({len(results)} found)")
-    click.echo("=" * 80)
+    buf = [f"\n🔍 Search Results for '{query}' in {field}", "=" * 80]
+    shown = 0
     
-    for article in results:
-        click.echo(f"\n#{article['id']} | {article['title']}")
-        click.echo(f"Author: {article['author'] or 'Unknown'}")
-        click.echo(f"Created: {article['created_at']}")
-        
-        # Show snippet of matching content
-        if field in ['all', 'content'] and query.lower() in article['content'].lower():
-            content = article['content']
-            index = content.lower().find(query.lower())
-            start = max(0, index - 50)
-            end = min(len(content), index + 100)
-            snippet = content[start:end]
-            click.echo(f"Content snippet: ...{snippet}...")
-        
-        if field in ['all', 'summary'] and article['summary'] and query.lower() in article['summary'].lower():
-            click.echo(f"Summary: {article['summary']}")
+    while results:
+        for article in results:
+            buf.append(f"\n#{article['id']} | {article['title']}")
+            buf.append(f"Author: {article['author'] or 'Unknown'}")
+            buf.append(f"Created: {article['created_at']}")
+            
+            # Columns that did not match come back without a snippet
+            if article['content_snippet']:
+                buf.append(f"Content snippet: {article['content_snippet']}")
+            
+            if article['summary_snippet']:
+                buf.append(f"Summary: {article['summary_snippet']}")
+        
+        shown += len(results)
+        click.echo("\n".join(buf))
+        buf.clear()
+        
+        if not next_cursor or not click.confirm(f"\nShow more results? ({shown} shown so far)"):
+            break
+        results, next_cursor = viewer.search_articles(query, field, mode, limit=page_size, after=next_cursor)
 
 @viewer_cli.command()
-@click.option('--db-path', default='articles.db', help='Path to database file')
 @click.option('--output', help='Output filename (default: auto-generated)')
-def export(db_path, output):
+@click.option('--compress', is_flag=True, help='Compress the export with zstd (.zst)')
+@pass_viewer
+def export(viewer, output, compress):
     """Export database to JSON"""
-    viewer = DatabaseViewer(db_path)
-    filename = viewer.export_to_json(output)
+    filename = viewer.export_to_json(output, compress)
     click.echo(f"Database exported to: {filename}")
 
 if __name__ == "__main__":
@@ -0,0 +1,299 @@
+"""Article extraction from raw HTML
+
+Needs nothing but lxml, so parse worker processes can load it without the
+scraper's HTTP and Gemini dependencies.
+"""
+import re
+from typing import Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
+from lxml import etree
+
+# Characters that disqualify a candidate author string
+_BAD_AUTHOR_CHARS = frozenset('<>@#$%^&*()+=[]{}|\\:";\'?,./')
+
+class ArticleExtractor:
+    """Finds the title, author and main text of an article page"""
+    
+    # Author hints in priority order: class substrings, then rel="author"
+    _AUTHOR_CLASS_SUBSTRINGS = ('author', 'byline', 'writer')
+    # Content hints in priority order, after <article> and before <main>
+    _CONTENT_CLASS_SUBSTRINGS = ('content', 'post-body', 'story-body', 'article-body')
+    # Exact class names tried after <main>
+    _CONTENT_CLASS_NAMES = ('post', 'article', 'story')
+    # Precompiled "could this class attribute match any hint" checks, so the
+    # per-hint loops only run for the few elements that might match
+    _AUTHOR_HINT_RE = re.compile('|'.join(map(re.escape, _AUTHOR_CLASS_SUBSTRINGS)))
+    _CONTENT_HINT_RE = re.compile('|'.join(
+        [*map(re.escape, _CONTENT_CLASS_SUBSTRINGS)]
+        + [rf'(?<!\S){re.escape(name)}(?!\S)' for name in _CONTENT_CLASS_NAMES]
+    ))
+    _MAIN_PRIORITY = 1 + len(_CONTENT_CLASS_SUBSTRINGS)
+    # Title sources by tag; <meta> sources are told apart by attribute
+    _TITLE_TAG_RANKS = {'h1': 0, 'title': 1, 'h2': 4}
+    # Elements whose text is left out of the article body
+    _UNWANTED_TAGS = frozenset(('script', 'style', 'nav', 'header', 'footer', 'aside', 'advertisement'))
+    # Elements whose strings never count as page text
+    _NON_TEXT_TAGS = frozenset(('script', 'style', 'template', 'rt', 'rp'))
+    # Everything the article body text leaves out
+    _CONTENT_SKIP_TAGS = _UNWANTED_TAGS | _NON_TEXT_TAGS
+    
+    @classmethod
+    def _iter_strings(cls, element: etree._Element, skip_tags: frozenset = _NON_TEXT_TAGS) -> Iterator[str]:
+        """Text nodes under an element in document order, one string each, without
+        modifying the tree. As with BeautifulSoup's get_text, comments are left out
+        and strings inside script/style/template/rt/rp only count as the text of
+        that enclosing element; other skip_tags subtrees are left out entirely."""
+        if next(element.iterdescendants(*skip_tags), None) is None:
+            # Every string below is of the element's own kind: let lxml walk it in C
+            return element.itertext()
+        return cls._walk_strings(element, skip_tags)
+    
+    @classmethod
+    def _walk_strings(cls, element: etree._Element, skip_tags: frozenset) -> Iterator[str]:
+        """_iter_strings for subtrees that contain skip_tags"""
+        non_text = cls._NON_TEXT_TAGS
+        # The kind of string that counts: None for ordinary text, else the tag
+        own = element.tag if element.tag in non_text else None
+        
+        if element.text:
+            yield element.text
+        # Per open element: (children still to visit, kind of string inside it,
+        # its tail, kind of string the tail is)
+        stack = [(iter(element), own, None, own)]
+        while stack:
+            children, kind, tail, tail_kind = stack[-1]
+            child = next(children, None)
+            if child is None:
+                stack.pop()
+                if tail and tail_kind == own:
+                    yield tail
+                continue
+            
+            tag = child.tag
+            child_kind = tag if tag in non_text else kind
+            if (not isinstance(tag, str) or (tag in skip_tags and tag not in non_text)
+                    or (own is None and child_kind is not None)):
+                # Comment, or a subtree with nothing that counts; the text after
+                # it is still a string of its own
+                if child.tail and kind == own:
+                    yield child.tail
+                continue
+            
+            if child.text and child_kind == own:
+                yield child.text
+            stack.append((iter(child), child_kind, child.tail, kind))
+    
+    @classmethod
+    def _text(cls, element: etree._Element, separator: str = '', strip: bool = False) -> str:
+        """Text of an element and its descendants, joined like BeautifulSoup's get_text"""
+        strings = cls._iter_strings(element)
+        if strip:
+            return separator.join(s for s in (string.strip() for string in strings) if s)
+        return separator.join(strings)
+    
+    @classmethod
+    def _bounded_text(cls, element: etree._Element, separator: str = ' ', limit: int = 10000) -> str:
+        """Content text: like _text(strip=True) without the unwanted tags, but stops
+        collecting strings once limit chars are reached"""
+        parts = []
+        total = 0
+        for string in cls._iter_strings(element, cls._CONTENT_SKIP_TAGS):
+            string = string.strip()
+            if not string:
+                continue
+            if parts:
+                total += len(separator)
+            parts.append(string)
+            total += len(string)
+            if total >= limit:
+                break
+        return separator.join(parts)[:limit]
+    
+    @classmethod
+    def _content_priority(cls, element: etree._Element, class_str: str) -> Optional[int]:
+        """Rank of the first content hint an element matches (lower is better)"""
+        if element.tag == 'article':
+            return 0
+        if not class_str or cls._CONTENT_HINT_RE.search(class_str) is None:
+            return cls._MAIN_PRIORITY if element.tag == 'main' else None
+        for offset, substring in enumerate(cls._CONTENT_CLASS_SUBSTRINGS):
+            if substring in class_str:
+                return 1 + offset
+        if element.tag == 'main':
+            return cls._MAIN_PRIORITY
+        classes = class_str.split()
+        for offset, class_name in enumerate(cls._CONTENT_CLASS_NAMES):
+            if class_name in classes:
+                return cls._MAIN_PRIORITY + 1 + offset
+        return None
+    
+    @staticmethod
+    def _is_plausible_author(author: str) -> bool:
+        """Filter out obviously wrong author results"""
+        if author and len(author) < 100 and len(author) > 2:
+            # Skip if it contains too many special characters or looks like a URL
+            if _BAD_AUTHOR_CHARS.isdisjoint(author):
+                return True
+        return False
+    
+    @classmethod
+    def _title_rank(cls, element: etree._Element) -> Optional[int]:
+        """Position of an element in the title fallback order, if it is a title source"""
+        if element.tag == 'meta':
+            if element.get('property') == 'og:title':
+                return 2
+            if element.get('name') == 'twitter:title':
+                return 3
+            return None
+        return cls._TITLE_TAG_RANKS.get(element.tag)
+    
+    @classmethod
+    def _extract_all(cls, root: etree._Element, url: str) -> Tuple[str, str, str]:
+        """Extract title, author and main content in a single walk over the tree"""
+        # First text per title source: h1, <title>, og:title, twitter:title, h2
+        titles = [None] * 5
+        meta_author = None
+        meta_article_author = None
+        # First acceptable text per hint: class*=author, byline, writer, rel=author
+        authors = [None] * (len(cls._AUTHOR_CLASS_SUBSTRINGS) + 1)
+        # Content sources outside the unwanted tags, in document order
+        content_candidates = []
+        paragraphs = []
+        body = None
+        unwanted_depth = 0
+        # Inside script/template/rt/...: those strings belong to the enclosing
+        # non-text element alone, so any other element in there has no text
+        non_text_depth = 0
+        
+        for event, element in etree.iterwalk(root, events=('start', 'end')):
+            tag = element.tag
+            if event == 'end':
+                if tag in cls._UNWANTED_TAGS:
+                    unwanted_depth -= 1
+                if tag in cls._NON_TEXT_TAGS:
+                    non_text_depth -= 1
+                continue
+            
+            if tag in cls._NON_TEXT_TAGS:
+                non_text_depth += 1
+            textless = non_text_depth and tag not in cls._NON_TEXT_TAGS
+            
+            # Title and author look at the page as served, unwanted tags included
+            rank = cls._title_rank(element)
+            if rank is not None and titles[rank] is None:
+                if tag == 'meta':
+                    titles[rank] = element.get('content', '').strip()
+                else:
+                    titles[rank] = '' if textless else cls._text(element).strip()
+            
+            if tag == 'meta':
+                if meta_author is None and element.get('name') == 'author':
+                    meta_author = element
+                if meta_article_author is None and element.get('property') == 'article:author':
+                    meta_article_author = element
+            
+            class_str = element.get('class', '')
+            text = None
+            if class_str and cls._AUTHOR_HINT_RE.search(class_str) is not None:
+                for i, substring in enumerate(cls._AUTHOR_CLASS_SUBSTRINGS):
+                    if authors[i] is None and substring in class_str:
+                        if text is None:
+                            text = '' if textless else cls._text(element).strip()
+                        if cls._is_plausible_author(text):
+                            authors[i] = text
+            
+            if authors[-1] is None and element.get('rel', '').split() == ['author']:
+                if text is None:
+                    text = '' if textless else cls._text(element).strip()
+                if cls._is_plausible_author(text):
+                    authors[-1] = text
+            
+            # Content ignores everything inside script/nav/header/footer/...
+            if tag in cls._UNWANTED_TAGS:
+                unwanted_depth += 1
+            if unwanted_depth or textless:
+                continue
+            
+            priority = cls._content_priority(element, class_str)
+            if priority is not None:
+                content_candidates.append((priority, element))
+            if tag == 'p':
+                paragraphs.append(element)
+            elif tag == 'body' and body is None:
+                body = element
+        
+        title = next((t[:200] for t in titles if t and len(t) > 3), None)
+        if title is None:
+            title = f"Article from {urlparse(url).netloc}"
+        
+        author = None
+        for meta in (meta_author, meta_article_author):
+            if meta is not None:
+                candidate = meta.get('content', '').strip()
+                if candidate and len(candidate) < 100:
+                    author = candidate
+                    break
+        if author is None:
+            author = next((a for a in authors if a), "Unknown")
+        
+        content = cls._select_content(content_candidates, paragraphs, body)
+        return title, author, content
+    
+    @classmethod
+    def _select_content(cls, candidates: List[Tuple[int, etree._Element]],
+                        paragraphs: List[etree._Element], body: Optional[etree._Element]) -> str:
+        """Pick the main article text from the candidates found by _extract_all"""
+        # Keep the longest candidate text, preferring the higher-priority hint
+        # (then document order) on equal length
+        best_content = ""
+        best_key = (0, 0)
+        
+        # Texts are capped at the returned length, so a huge <body> or wrapper
+        # is never materialised in full; candidates past the cap tie on length
+        for priority, element in candidates:
+            text = cls._bounded_text(element)
+            key = (len(text), -priority)
+            if len(text) > 100 and key > best_key:
+                best_key = key
+                best_content = text
+        
+        # Fallback: extract all paragraph text
+        if not best_content or len(best_content) < 200:
+            texts = []
+            total = 0
+            for p in paragraphs:
+                text = cls._bounded_text(p, separator='')
+                if text:
+                    texts.append(text)
+                    total += len(text) + 1
+                    if total > 10000:
+                        break
+            paragraph_text = ' '.join(texts)[:10000]
+            if len(paragraph_text) > len(best_content):
+                best_content = paragraph_text
+        
+        # Final fallback: get all text from body
+        if (not best_content or len(best_content) < 100) and body is not None:
+            best_content = cls._bounded_text(body)
+        
+        return best_content[:10000] if best_content else "No content extracted"
+
+
+def parse_html(html: bytes, url: str, encoding: str = 'utf-8') -> Optional[Dict[str, str]]:
+    """Parse a page and extract its article data"""
+    try:
+        parser = etree.HTMLParser(encoding=encoding)
+    except LookupError:
+        # An encoding Python knows but libxml2 does not: read the page as UTF-8
+        parser = etree.HTMLParser(encoding='utf-8')
+    root = etree.fromstring(html, parser)
+    if root is None:
+        return None
+    
+    title, author, content = ArticleExtractor._extract_all(root, url)
+    return {
+        'title': title,
+        'author': author,
+        'content': content,
+        'source_url': url
+    }
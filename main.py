@@ -1,20 +1,39 @@
 import asyncio
+import atexit
+import codecs
+import hashlib
 import logging
+import multiprocessing
 import re
 import sqlite3
+import threading
 import time
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from urllib.parse import urljoin, urlparse
 import aiohttp
 import click
 from google import genai
 from google.genai import types
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from dotenv import load_dotenv
+from extractor import parse_html
 import os
 
+# aiohttp decodes Brotli responses only when one of these is importable
+try:
+    import brotli
+except ImportError:
+    try:
+        import brotlicffi as brotli
+    except ImportError:
+        brotli = None
+
 # Load environment variables
 load_dotenv()
 
@@ -29,6 +48,64 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+_QUOTE_STRAINER = SoupStrainer('div', class_='quote')
+
+# Precompiled patterns used on every scraped article / summary
+_WS_RE = re.compile(r'\s+')
+_NL_RE = re.compile(r'\n+')
+# Each match is one sentence body (the text between terminators)
+_SENTENCE_RE = re.compile(r'[^.!?]+')
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset=["\']?([\w-]+)', re.IGNORECASE)
+
+def _text_encoding(charset: Optional[str]) -> Optional[str]:
+    """The charset label as given if it names a text encoding, else None"""
+    if not charset:
+        return None
+    try:
+        codec = codecs.lookup(charset)
+    except LookupError:
+        return None
+    return charset if codec._is_text_encoding else None
+
+def create_session() -> aiohttp.ClientSession:
+    """Create an HTTP session with a pooled keep-alive connector"""
+    connector = aiohttp.TCPConnector(
+        limit=100,
+        limit_per_host=64,
+        ttl_dns_cache=300,
+        keepalive_timeout=75,
+    )
+    # Compressed bodies are decoded by aiohttp as they are read
+    return aiohttp.ClientSession(connector=connector, auto_decompress=True)
+
+class TTLCache:
+    """Small in-process cache whose entries expire ttl seconds after being set"""
+    
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: Dict[str, Tuple[float, Any]] = {}
+    
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires < time.monotonic():
+            del self._data[key]
+            return None
+        return value
+    
+    def set(self, key: str, value: Any):
+        # Re-setting a key moves it to the newest position instead of evicting
+        if self._data.pop(key, None) is None and len(self._data) >= self.maxsize:
+            # Evict the oldest entry (dicts keep insertion order)
+            del self._data[next(iter(self._data))]
+        self._data[key] = (time.monotonic() + self.ttl, value)
+
+# Parsed JSON from the Reddit / Hacker News APIs, keyed by URL
+_API_CACHE = TTLCache(ttl=60)
+
 class UniversalWebScraper:
     """Universal web scraper that can handle most websites"""
     
@@ -38,142 +115,30 @@ class UniversalWebScraper:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
+            'Accept-Encoding': 'gzip, deflate, br' if brotli is not None else 'gzip, deflate',
             'Connection': 'keep-alive',
         }
     
-    def _extract_title(self, soup: BeautifulSoup, url: str) -> str:
-        """Extract title from various possible locations"""
-        title_candidates = [
-            soup.find('h1'),
-            soup.find('title'),
-            soup.find('meta', property='og:title'),
-            soup.find('meta', attrs={'name': 'twitter:title'}),
-            soup.find('h2'),
-        ]
-        
-        for candidate in title_candidates:
-            if candidate:
-                if candidate.name == 'meta':
-                    title = candidate.get('content', '').strip()
-                else:
-                    title = candidate.get_text().strip()
-                
-                if title and len(title) > 3:
-                    return title[:200]
-        
-        parsed_url = urlparse(url)
-        return f"Article from {parsed_url.netloc}"
-    
-    def _extract_author(self, soup: BeautifulSoup) -> str:
-        """Extract author from various possible locations - FIXED VERSION"""
-        # Try meta tags first
-        meta_author = soup.find('meta', attrs={'name': 'author'})
-        if meta_author:
-            author = meta_author.get('content', '').strip()
-            if author and len(author) < 100:
-                return author
-        
-        meta_article_author = soup.find('meta', property='article:author')
-        if meta_article_author:
-            author = meta_article_author.get('content', '').strip()
-            if author and len(author) < 100:
-                return author
-        
-        # Try CSS selectors using select() method instead of find()
-        author_selectors = [
-            '[class*="author"]',
-            '[class*="byline"]', 
-            '[class*="writer"]',
-            '[rel="author"]',
-            '.author-name',
-            '.byline',
-            '.post-author',
-            '.author',
-            '.writer',
-            '.by-author'
-        ]
-        
-        for selector in author_selectors:
-            try:
-                elements = soup.select(selector)
-                for element in elements:
-                    author = element.get_text().strip()
-                    # Filter out obviously wrong results
-                    if author and len(author) < 100 and len(author) > 2:
-                        # Skip if it contains too many special characters or looks like a URL
-                        if not re.search(r'[<>@#$%^&*()+=\[\]{}|\\:";\'<>?,./]', author):
-                            return author
-            except Exception as e:
-                logger.debug(f"Error with selector {selector}: {e}")
-                continue
-        
-        return "Unknown"
-    
-    def _extract_main_content(self, soup: BeautifulSoup) -> str:
-        """Extract main article content using multiple strategies"""
-        # Remove unwanted elements
-        for tag in soup(['script', 'style', 'nav', 'header', 'footer', 'aside', 'advertisement']):
-            tag.decompose()
-        
-        content_selectors = [
-            'article',
-            '[class*="content"]',
-            '[class*="post-content"]',
-            '[class*="entry-content"]',
-            '[class*="article-content"]',
-            '[class*="post-body"]',
-            '[class*="story-body"]',
-            '[class*="article-body"]',
-            'main',
-            '.content',
-            '.post',
-            '.article',
-            '.story',
-        ]
-        
-        best_content = ""
-        max_length = 0
-        
-        for selector in content_selectors:
-            try:
-                elements = soup.select(selector)
-                for element in elements:
-                    text = element.get_text(separator=' ', strip=True)
-                    if len(text) > max_length and len(text) > 100:
-                        max_length = len(text)
-                        best_content = text
-            except Exception as e:
-                logger.debug(f"Error with content selector {selector}: {e}")
-                continue
-        
-        # Fallback: extract all paragraph text
-        if not best_content or len(best_content) < 200:
-            try:
-                paragraphs = soup.find_all('p')
-                paragraph_text = ' '.join([p.get_text(strip=True) for p in paragraphs if p.get_text(strip=True)])
-                if len(paragraph_text) > len(best_content):
-                    best_content = paragraph_text
-            except Exception as e:
-                logger.debug(f"Error extracting paragraphs: {e}")
-        
-        # Final fallback: get all text from body
-        if not best_content or len(best_content) < 100:
-            try:
-                body = soup.find('body')
-                if body:
-                    best_content = body.get_text(separator=' ', strip=True)
-            except Exception as e:
-                logger.debug(f"Error extracting body text: {e}")
-        
-        return best_content[:10000] if best_content else "No content extracted"
-    
     def _clean_url(self, url: str) -> str:
         """Clean and validate URL"""
         if not url.startswith(('http://', 'https://')):
             url = 'https://' + url
         return url
     
+    @staticmethod
+    async def _read_body(response: aiohttp.ClientResponse) -> Tuple[bytes, str]:
+        """Read the raw body and work out its charset without decoding it"""
+        html = await response.read()
+        
+        # Like a browser: header charset, else a <meta> near the top, else UTF-8.
+        # Unknown names are skipped, as response.text() does
+        encoding = _text_encoding(response.charset)
+        if encoding is None:
+            match = _META_CHARSET_RE.search(html, 0, 4096)
+            if match:
+                encoding = _text_encoding(match.group(1).decode('ascii'))
+        return html, encoding or 'utf-8'
+    
     async def scrape_url(self, url: str, timeout: int = 30) -> Optional[Dict[str, str]]:
         """Scrape a single URL and extract article data"""
         url = self._clean_url(url)
@@ -185,23 +150,19 @@ class UniversalWebScraper:
                     logger.warning(f"HTTP {response.status} for {url}")
                     return None
                 
-                html = await response.text()
-                soup = BeautifulSoup(html, 'html.parser')
-                
-                title = self._extract_title(soup, url)
-                author = self._extract_author(soup)
-                content = self._extract_main_content(soup)
-                
-                if not content or len(content) < 50:
-                    logger.warning(f"Insufficient content extracted from {url}")
-                    return None
-                
-                return {
-                    'title': title,
-                    'author': author,
-                    'content': content,
-                    'source_url': url
-                }
+                html, encoding = await self._read_body(response)
+            
+            if not html.strip():
+                logger.warning(f"Empty document from {url}")
+                return None
+            
+            article = await _parse_page(html, url, encoding)
+            
+            if article is None or not article['content'] or len(article['content']) < 50:
+                logger.warning(f"Insufficient content extracted from {url}")
+                return None
+            
+            return article
                 
         except asyncio.TimeoutError:
             logger.error(f"Timeout scraping {url}")
@@ -212,6 +173,8 @@ class UniversalWebScraper:
     
     async def scrape_multiple_urls(self, urls: List[str], max_concurrent: int = 5) -> List[Dict[str, str]]:
         """Scrape multiple URLs concurrently"""
+        # Overlapping source lists shouldn't scrape (and store) a page twice
+        urls = list(dict.fromkeys(urls))
         semaphore = asyncio.Semaphore(max_concurrent)
         
         async def scrape_with_semaphore(url):
@@ -230,6 +193,50 @@ class UniversalWebScraper:
         
         return articles
 
+_PARSE_POOL: Optional[ProcessPoolExecutor] = None
+# Bodies smaller than this are parsed on the event loop: that takes a few
+# milliseconds, less than handing the page to a worker process
+_INLINE_PARSE_BYTES = 128 * 1024
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    """Process pool shared by every scraper, created on first use"""
+    global _PARSE_POOL
+    if _PARSE_POOL is None:
+        # First use is inside the event loop, after aiohttp's resolver and the
+        # default executor have started threads, so never fork this process:
+        # workers come from a fork server (or are spawned where there is none)
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+        # Workers are started on demand (at most one per page being parsed)
+        _PARSE_POOL = ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=context)
+    return _PARSE_POOL
+
+def close_parse_pool():
+    """Shut down the shared parse pool, if one was started"""
+    global _PARSE_POOL
+    if _PARSE_POOL is not None:
+        _PARSE_POOL.shutdown()
+        _PARSE_POOL = None
+
+atexit.register(close_parse_pool)
+
+async def _parse_page(html: bytes, url: str, encoding: str) -> Optional[Dict[str, str]]:
+    """Parse a page inline when it is small, else in the shared process pool so
+    the event loop keeps serving other responses"""
+    global _PARSE_POOL
+    if len(html) < _INLINE_PARSE_BYTES:
+        return parse_html(html, url, encoding)
+    
+    pool = _get_parse_pool()
+    try:
+        return await asyncio.get_running_loop().run_in_executor(pool, parse_html, html, url, encoding)
+    except BrokenProcessPool:
+        # A worker died (and took this page with it); later pages get a new pool
+        if _PARSE_POOL is pool:
+            _PARSE_POOL = None
+            pool.shutdown(wait=False)
+        raise
+
 class NewsSourceScraper:
     """Specialized scrapers for popular news sources"""
     
@@ -237,82 +244,102 @@ class NewsSourceScraper:
         self.session = session
         self.universal_scraper = UniversalWebScraper(session)
     
+    async def _get_json(self, url: str, headers: Optional[Dict[str, str]] = None) -> Tuple[int, Any]:
+        """GET a JSON API endpoint, serving repeat requests from a short-lived cache"""
+        data = _API_CACHE.get(url)
+        if data is not None:
+            return 200, data
+        
+        async with self.session.get(url, headers=headers) as response:
+            if response.status != 200:
+                return response.status, None
+            data = await response.json()
+        
+        if data is not None:
+            _API_CACHE.set(url, data)
+        return 200, data
+    
     async def scrape_reddit_rss(self, subreddit: str = "news", limit: int = 5) -> List[Dict[str, str]]:
         """Scrape Reddit RSS feed"""
         try:
             url = f"https://www.reddit.com/r/{subreddit}/hot.json?limit={limit}"
             headers = {'User-Agent': 'NewsBot 1.0'}
             
-            async with self.session.get(url, headers=headers) as response:
-                if response.status != 200:
-                    logger.error(f"Reddit API returned status {response.status}")
-                    return []
-                    
-                data = await response.json()
+            status, data = await self._get_json(url, headers=headers)
+            if status != 200:
+                logger.error(f"Reddit API returned status {status}")
+                return []
+            
+            articles = []
+            for post in data['data']['children'][:limit]:
+                post_data = post['data']
                 
-                articles = []
-                for post in data['data']['children'][:limit]:
-                    post_data = post['data']
-                    
-                    if post_data.get('is_self') and not post_data.get('selftext'):
-                        continue
-                    
-                    content = post_data.get('selftext', '') or f"Reddit post: {post_data['title']}"
-                    
-                    article = {
-                        'title': post_data['title'],
-                        'author': f"u/{post_data['author']}",
-                        'content': content,
-                        'source_url': f"https://reddit.com{post_data['permalink']}"
-                    }
-                    articles.append(article)
+                if post_data.get('is_self') and not post_data.get('selftext'):
+                    continue
                 
-                logger.info(f"Scraped {len(articles)} posts from r/{subreddit}")
-                return articles
+                content = post_data.get('selftext', '') or f"Reddit post: {post_data['title']}"
+                
+                article = {
+                    'title': post_data['title'],
+                    'author': f"u/{post_data['author']}",
+                    'content': content,
+                    'source_url': f"https://reddit.com{post_data['permalink']}"
+                }
+                articles.append(article)
+            
+            logger.info(f"Scraped {len(articles)} posts from r/{subreddit}")
+            return articles
                 
         except Exception as e:
             logger.error(f"Error scraping Reddit: {e}")
             return []
     
-    async def scrape_hackernews_api(self, limit: int = 5) -> List[Dict[str, str]]:
-        """Enhanced Hacker News scraper"""
-        articles = []
-        
+    async def _fetch_hn_item(self, story_id: int, semaphore: asyncio.Semaphore) -> Optional[Dict[str, str]]:
+        """Fetch one Hacker News story, scraping its link when it has no text"""
         try:
-            async with self.session.get("https://hacker-news.firebaseio.com/v0/topstories.json") as response:
-                if response.status != 200:
-                    logger.error(f"HackerNews API returned status {response.status}")
-                    return []
-                story_ids = await response.json()
+            async with semaphore:
+                _, story = await self._get_json(f"https://hacker-news.firebaseio.com/v0/item/{story_id}.json")
             
-            for story_id in story_ids[:limit]:
+            if not story or not story.get('title'):
+                return None
+            
+            content = story.get('text', '') or story['title']
+            
+            # If there's a URL but no text, try to scrape the content
+            if story.get('url') and not story.get('text'):
                 try:
-                    async with self.session.get(f"https://hacker-news.firebaseio.com/v0/item/{story_id}.json") as response:
-                        story = await response.json()
-                    
-                    if story and story.get('title'):
-                        content = story.get('text', '') or story['title']
-                        
-                        # If there's a URL but no text, try to scrape the content
-                        if story.get('url') and not story.get('text'):
-                            try:
-                                scraped = await self.universal_scraper.scrape_url(story['url'])
-                                if scraped and scraped.get('content'):
-                                    content = scraped['content'][:1000] + "..."
-                            except Exception as e:
-                                logger.debug(f"Could not scrape HN story URL: {e}")
-                        
-                        articles.append({
-                            'title': story['title'],
-                            'author': story.get('by', 'Unknown'),
-                            'content': content,
-                            'source_url': f"https://news.ycombinator.com/item?id={story_id}"
-                        })
-                    
-                    await asyncio.sleep(0.1)  # Rate limiting
+                    scraped = await self.universal_scraper.scrape_url(story['url'])
+                    if scraped and scraped.get('content'):
+                        content = scraped['content'][:1000] + "..."
                 except Exception as e:
-                    logger.debug(f"Error processing HN story {story_id}: {e}")
-                    continue
+                    logger.debug(f"Could not scrape HN story URL: {e}")
+            
+            return {
+                'title': story['title'],
+                'author': story.get('by', 'Unknown'),
+                'content': content,
+                'source_url': f"https://news.ycombinator.com/item?id={story_id}"
+            }
+        except Exception as e:
+            logger.debug(f"Error processing HN story {story_id}: {e}")
+            return None
+    
+    async def scrape_hackernews_api(self, limit: int = 5) -> List[Dict[str, str]]:
+        """Enhanced Hacker News scraper"""
+        try:
+            status, story_ids = await self._get_json("https://hacker-news.firebaseio.com/v0/topstories.json")
+            if status != 200:
+                logger.error(f"HackerNews API returned status {status}")
+                return []
+            
+            # Items (and their linked pages) are independent, so fetch them
+            # concurrently; the semaphore caps in-flight item requests
+            semaphore = asyncio.Semaphore(16)
+            results = await asyncio.gather(
+                *(self._fetch_hn_item(story_id, semaphore) for story_id in story_ids[:limit]),
+                return_exceptions=True
+            )
+            articles = [result for result in results if isinstance(result, dict)]
             
             logger.info(f"Scraped {len(articles)} stories from Hacker News")
             return articles
@@ -321,117 +348,271 @@ class NewsSourceScraper:
             logger.error(f"Error scraping Hacker News: {e}")
             return []
 
+# Fixed statements, written once here and shared by every method that runs them
+SQL_INSERT_ARTICLE = '''
+    INSERT INTO articles (title, author, content, summary, source_url)
+    VALUES (?, ?, ?, ?, ?)
+'''
+
+SQL_GET_BY_ID = '''
+    SELECT id, title, author, content, summary, source_url, created_at
+    FROM articles WHERE id = ?
+'''
+
+# The content column is by far the largest; this variant skips reading it but
+# keeps the row's shape, with content as NULL
+SQL_GET_BY_ID_NO_CONTENT = '''
+    SELECT id, title, author, NULL AS content, summary, source_url, created_at
+    FROM articles WHERE id = ?
+'''
+
+SQL_COUNT_ARTICLES = 'SELECT COUNT(*) FROM articles'
+
+# LIMIT -1 means no limit in SQLite
+SQL_LIST_ARTICLES = '''
+    SELECT id, title, author, source_url, created_at,
+           substr(summary, 1, 160) AS summary_preview
+    FROM articles ORDER BY created_at DESC, id
+    LIMIT ? OFFSET ?
+'''
+
+SQL_ALL_ARTICLES = '''
+    SELECT id, title, author, summary, source_url, created_at
+    FROM articles ORDER BY created_at DESC, id
+'''
+
+SCHEMA_STATEMENTS = (
+    '''
+    CREATE TABLE IF NOT EXISTS articles (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        title TEXT NOT NULL,
+        author TEXT,
+        content TEXT NOT NULL,
+        summary TEXT,
+        source_url TEXT NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    ''',
+    # Listings run newest first with id as the tie-break, so a LIMIT/OFFSET
+    # page is a range scan of this index, not a sort
+    'CREATE INDEX IF NOT EXISTS idx_articles_created_id ON articles(created_at DESC, id)',
+)
+
+# Live DatabaseManagers by id(), so the module-level cache below can find them
+_db_registry = weakref.WeakValueDictionary()
+
+@lru_cache(maxsize=128)
+def _cached_get_summary(db_id: int, article_id: int, include_content: bool = True) -> Optional[sqlite3.Row]:
+    return _db_registry[db_id].get_summary_by_id(article_id, include_content)
+
 class DatabaseManager:
     """Manages SQLite database operations"""
     
     def __init__(self, db_path: str = None):
         # Use environment variable or default
         self.db_path = db_path or os.getenv('DB_PATH', 'articles.db')
+        # One connection for the manager's lifetime instead of one per call;
+        # it may be used from worker threads, so access is serialised by a lock
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                                    cached_statements=256)
+        # Rows are C-level objects indexed by column name, not per-row dicts
+        self.conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        # get_summary_by_id is the hot single-row lookup; it reuses one cursor
+        self._get_by_id_cur = self.conn.cursor()
+        _db_registry[id(self)] = self
         self.init_database()
     
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            if self.conn is not None:
+                self.conn.close()
+                self.conn = None
+        # Another manager may reuse this id() later
+        _db_registry.pop(id(self), None)
+        _cached_get_summary.cache_clear()
+    
+    def _configure_connection(self, cursor: sqlite3.Cursor):
+        """WAL lets readers run alongside the writer and fsyncs far less often"""
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute(f"PRAGMA mmap_size={int(os.getenv('SQLITE_MMAP_SIZE', 268435456))}")
+        cursor.execute(f"PRAGMA cache_size={int(os.getenv('SQLITE_CACHE_SIZE', -65536))}")
+    
+    def _init_schema(self):
+        """Run SCHEMA_STATEMENTS in one transaction: one commit instead of one per DDL"""
+        # sqlite3 autocommits DDL unless a transaction is opened explicitly;
+        # the connection context manager commits, or rolls back on error
+        with self.conn:
+            self.conn.execute('BEGIN')
+            for statement in SCHEMA_STATEMENTS:
+                self.conn.execute(statement)
+    
     def init_database(self):
         """Initialize the database with required tables"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS articles (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    title TEXT NOT NULL,
-                    author TEXT,
-                    content TEXT NOT NULL,
-                    summary TEXT,
-                    source_url TEXT NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            
-            conn.commit()
-            conn.close()
-            logger.info(f"Database initialized at {self.db_path}")
+            with self._lock:
+                cursor = self.conn.cursor()
+                self._configure_connection(cursor)
+                
+                self._init_schema()
+                logger.info(f"Database initialized at {self.db_path}")
         except Exception as e:
             logger.error(f"Error initializing database: {e}")
             raise
     
+    @staticmethod
+    def _article_row(data: Dict[str, str]) -> tuple:
+        return (
+            data['title'],
+            data.get('author', ''),
+            data['content'],
+            data.get('summary', ''),
+            data['source_url']
+        )
+    
     def store_article(self, data: Dict[str, str]) -> int:
         """Store article data in database"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                INSERT INTO articles (title, author, content, summary, source_url)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (
-                data['title'],
-                data.get('author', ''),
-                data['content'],
-                data.get('summary', ''),
-                data['source_url']
-            ))
-            
-            article_id = cursor.lastrowid
-            conn.commit()
-            conn.close()
-            
-            logger.info(f"Stored article with ID: {article_id}")
-            return article_id
+            with self._lock:
+                cursor = self.conn.cursor()
+                
+                cursor.execute(SQL_INSERT_ARTICLE, self._article_row(data))
+                
+                article_id = cursor.lastrowid
+                self.conn.commit()
+                _cached_get_summary.cache_clear()
+                
+                logger.info(f"Stored article with ID: {article_id}")
+                return article_id
         except Exception as e:
+            with self._lock:
+                self.conn.rollback()
             logger.error(f"Error storing article: {e}")
             raise
     
-    def get_summary_by_id(self, article_id: int) -> Optional[Dict[str, str]]:
-        """Retrieve article summary by ID"""
+    def store_articles(self, rows: List[Dict[str, str]]) -> List[int]:
+        """Store several articles in one transaction, returning their IDs"""
+        if not rows:
+            return []
+        
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT id, title, author, content, summary, source_url, created_at
-                FROM articles WHERE id = ?
-            ''', (article_id,))
-            
-            result = cursor.fetchone()
-            conn.close()
-            
-            if result:
-                return {
-                    'id': result[0],
-                    'title': result[1],
-                    'author': result[2],
-                    'content': result[3],
-                    'summary': result[4],
-                    'source_url': result[5],
-                    'created_at': result[6]
-                }
-            return None
+            with self._lock:
+                cursor = self.conn.cursor()
+                
+                cursor.executemany(SQL_INSERT_ARTICLE, [self._article_row(data) for data in rows])
+                
+                # AUTOINCREMENT ids are consecutive within a single write transaction
+                cursor.execute('SELECT last_insert_rowid()')
+                last_id = cursor.fetchone()[0]
+                self.conn.commit()
+                _cached_get_summary.cache_clear()
+                
+                article_ids = list(range(last_id - len(rows) + 1, last_id + 1))
+                logger.info(f"Stored {len(article_ids)} articles with IDs: {article_ids}")
+                return article_ids
+        except Exception as e:
+            with self._lock:
+                self.conn.rollback()
+            logger.error(f"Error storing articles: {e}")
+            raise
+    
+    def get_summary_by_id(self, article_id: int, include_content: bool = True) -> Optional[sqlite3.Row]:
+        """Retrieve article summary by ID (content is None unless include_content)"""
+        try:
+            with self._lock:
+                cursor = self._get_by_id_cur
+                cursor.execute(SQL_GET_BY_ID if include_content else SQL_GET_BY_ID_NO_CONTENT,
+                               (article_id,))
+                return cursor.fetchone()
         except Exception as e:
             logger.error(f"Error retrieving article {article_id}: {e}")
             return None
     
-    def get_all_articles(self) -> List[Dict[str, str]]:
-        """Retrieve all articles"""
+    def get_summary_by_id_cached(self, article_id: int, include_content: bool = True) -> Optional[sqlite3.Row]:
+        """get_summary_by_id through a small LRU cache (cleared on every write)"""
+        return _cached_get_summary(id(self), article_id, include_content)
+    
+    def get_summaries_by_ids(self, article_ids: List[int],
+                             content_len: Optional[int] = None) -> Dict[int, sqlite3.Row]:
+        """Retrieve content and summary for several articles at once, keyed by ID.
+        With content_len, content is cut to that many chars inside SQLite and
+        content_length holds its full length."""
+        results = {}
+        if not article_ids:
+            return results
+        
+        if content_len is None:
+            columns, params = 'content', []
+        else:
+            columns, params = 'substr(content, 1, ?) AS content, length(content) AS content_length', [content_len]
+        
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT id, title, author, summary, source_url, created_at
-                FROM articles ORDER BY created_at DESC
-            ''')
-            
-            results = cursor.fetchall()
-            conn.close()
+            with self._lock:
+                cursor = self.conn.cursor()
+                
+                # Stay well under SQLite's bound-parameter limit
+                for start in range(0, len(article_ids), 500):
+                    batch = article_ids[start:start + 500]
+                    placeholders = ','.join('?' * len(batch))
+                    cursor.execute(f'''
+                        SELECT id, {columns}, summary
+                        FROM articles WHERE id IN ({placeholders})
+                    ''', [*params, *batch])
+                    
+                    for row in cursor.fetchall():
+                        results[row['id']] = row
+                return results
+        except Exception as e:
+            logger.error(f"Error retrieving articles {article_ids}: {e}")
+            return {}
+    
+    def count_articles(self) -> int:
+        """Number of stored articles"""
+        try:
+            with self._lock:
+                cursor = self.conn.cursor()
+                cursor.execute(SQL_COUNT_ARTICLES)
+                return cursor.fetchone()[0]
+        except Exception as e:
+            logger.error(f"Error counting articles: {e}")
+            return 0
+    
+    def iter_articles(self, limit: Optional[int] = None, offset: int = 0,
+                      batch_size: int = 256) -> Iterator[sqlite3.Row]:
+        """Yield articles newest first, without content or full summaries"""
+        try:
+            with self._lock:
+                cursor = self.conn.cursor()
+                
+                cursor.execute(SQL_LIST_ARTICLES, (-1 if limit is None else limit, offset))
             
-            return [{
-                'id': row[0],
-                'title': row[1],
-                'author': row[2],
-                'summary': row[3],
-                'source_url': row[4],
-                'created_at': row[5]
-            } for row in results]
+            # Rows are pulled a batch at a time; the lock is only held while
+            # fetching, never across a yield
+            while True:
+                with self._lock:
+                    rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from rows
+        except Exception as e:
+            logger.error(f"Error retrieving articles: {e}")
+    
+    def get_articles_page(self, limit: Optional[int] = None, offset: int = 0) -> List[sqlite3.Row]:
+        """Retrieve one page of articles, newest first, without content or full summaries"""
+        return list(self.iter_articles(limit, offset))
+    
+    def get_all_articles(self) -> List[sqlite3.Row]:
+        """Retrieve all articles"""
+        try:
+            with self._lock:
+                cursor = self.conn.cursor()
+                
+                cursor.execute(SQL_ALL_ARTICLES)
+                
+                return cursor.fetchall()
         except Exception as e:
             logger.error(f"Error retrieving articles: {e}")
             return []
@@ -445,16 +626,18 @@ class TextProcessor:
         if not text:
             return ""
         
-        # Remove HTML tags
-        soup = BeautifulSoup(text, 'html.parser')
-        text = soup.get_text()
+        # Remove HTML tags; most scraped text is already tag- and entity-free,
+        # so only build a DOM when there is markup to strip or decode
+        if '<' in text or '&' in text:
+            soup = BeautifulSoup(text, 'lxml')
+            text = soup.get_text()
         
         # Normalize whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = _WS_RE.sub(' ', text)
         text = text.strip()
         
         # Remove extra newlines
-        text = re.sub(r'\n+', '\n', text)
+        text = _NL_RE.sub('\n', text)
         
         # Convert to lowercase as per requirements
         text = text.lower()
@@ -467,19 +650,17 @@ class TextProcessor:
         if not summary:
             return ""
         
-        # Remove extra whitespace and newlines
-        summary = re.sub(r'\s+', ' ', summary).strip()
-        summary = re.sub(r'\n+', ' ', summary)
+        # One scan over the summary: collapse whitespace per sentence and stop
+        # as soon as max_sentences (3-5 as per requirements) are collected
+        sentences = []
+        for match in _SENTENCE_RE.finditer(summary):
+            sentence = ' '.join(match.group().split())
+            if sentence:
+                sentences.append(sentence)
+                if len(sentences) == max_sentences:
+                    break
         
-        # Split into sentences and limit to 3-5 sentences
-        sentences = re.split(r'[.!?]+', summary)
-        sentences = [s.strip() for s in sentences if s.strip()]
-        
-        # Limit to max_sentences (3-5 as per requirements)
-        if len(sentences) > max_sentences:
-            sentences = sentences[:max_sentences]
-        
-        return '. '.join(sentences) + '.' if sentences else summary
+        return '. '.join(sentences) + '.' if sentences else ' '.join(summary.split())
 
 class GeminiSummarizer:
     """Handles Gemini API integration for text summarization"""
@@ -488,11 +669,17 @@ class GeminiSummarizer:
         if not api_key:
             raise ValueError("Gemini API key is required")
         
+        # Rate limiting: at most this many requests in flight at once
+        self.rate_limit_concurrent = int(os.getenv('GEMINI_MAX_CONCURRENT', 4))
+        if self.rate_limit_concurrent < 1:
+            # A zero-slot semaphore would leave every summary waiting forever
+            raise ValueError(f"Invalid GEMINI_MAX_CONCURRENT: {self.rate_limit_concurrent} (must be at least 1)")
+        
         try:
             self.client = genai.Client(api_key=api_key)
             self.model = "gemini-2.0-flash-exp"
-            self.rate_limit_delay = 1  # Rate limiting
-            self.last_request_time = 0
+            # Summaries keyed by SHA-256 of the (truncated) text sent to the API
+            self._summary_cache: Dict[str, str] = {}
         except Exception as e:
             logger.error(f"Error initializing Gemini client: {e}")
             raise
@@ -500,17 +687,16 @@ class GeminiSummarizer:
     async def summarize_text(self, text: str) -> str:
         """Summarize text using Gemini API with enhanced error handling"""
         try:
-            # Rate limiting
-            current_time = time.time()
-            time_since_last = current_time - self.last_request_time
-            if time_since_last < self.rate_limit_delay:
-                await asyncio.sleep(self.rate_limit_delay - time_since_last)
-            
             # Limit text length to avoid API limits
             max_text_length = 8000
             if len(text) > max_text_length:
                 text = text[:max_text_length] + "..."
             
+            cache_key = hashlib.sha256(text.encode('utf-8')).hexdigest()
+            cached = self._summary_cache.get(cache_key)
+            if cached is not None:
+                return cached
+            
             # Enhanced prompt for better summaries
             prompt = f"""
             Please provide a concise summary of the following text in exactly 3-4 sentences. 
@@ -532,19 +718,18 @@ class GeminiSummarizer:
                 temperature=0.3,  # More consistent summaries
             )
             
-            response_text = ""
-            for chunk in self.client.models.generate_content_stream(
+            # Only the full text is used, so skip streaming and await the async client
+            response = await self.client.aio.models.generate_content(
                 model=self.model,
                 contents=contents,
                 config=generate_content_config,
-            ):
-                if chunk.text:
-                    response_text += chunk.text
-            
-            self.last_request_time = time.time()
+            )
+            response_text = response.text or ""
             
             if response_text.strip():
-                return TextProcessor.postprocess_summary(response_text.strip())
+                summary = TextProcessor.postprocess_summary(response_text.strip())
+                self._summary_cache[cache_key] = summary
+                return summary
             else:
                 logger.warning("Empty response from Gemini API")
                 return "Summary could not be generated."
@@ -574,7 +759,7 @@ class WebScraper:
                     return []
                     
                 html = await response.text()
-                soup = BeautifulSoup(html, 'html.parser')
+                soup = BeautifulSoup(html, 'lxml', parse_only=_QUOTE_STRAINER)
                 
                 quotes = soup.find_all('div', class_='quote')[:limit]
                 
@@ -631,9 +816,10 @@ class WebScraper:
 class ArticleProcessor:
     """Main application class that orchestrates the entire workflow"""
     
-    def __init__(self):
-        self.db = DatabaseManager()
+    def __init__(self, db: DatabaseManager = None):
+        self.db = db or DatabaseManager()
         self.text_processor = TextProcessor()
+        self._session = None  # created lazily inside the running event loop
         
         api_key = os.getenv('GEMINI_API_KEY')
         if not api_key:
@@ -646,49 +832,91 @@ class ArticleProcessor:
                 logger.error(f"Error initializing Gemini summarizer: {e}")
                 self.summarizer = None
     
+    async def get_session(self) -> aiohttp.ClientSession:
+        """Return the processor's shared HTTP session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            self._session = create_session()
+        return self._session
+    
+    async def close(self):
+        """Close the shared HTTP session and stop the page-parsing workers"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        close_parse_pool()
+    
+    async def _summarize_article(self, article: Dict[str, str], semaphore: asyncio.Semaphore):
+        """Fill in article['summary'] with better error handling"""
+        if not article['content']:
+            article['summary'] = "No summary available"
+            return
+        
+        async with semaphore:
+            try:
+                article['summary'] = await self.summarizer.summarize_text(article['content'])
+            except Exception as e:
+                logger.error(f"Error generating summary: {e}")
+                article['summary'] = "Summary generation failed"
+    
     async def process_articles(self, source: str, limit: int = 5) -> List[int]:
         """Complete workflow: scrape, summarize, and store articles"""
         article_ids = []
         
         try:
-            async with aiohttp.ClientSession() as session:
-                scraper = WebScraper(session)
-                articles = await scraper.scrape_articles(source, limit)
-                
-                logger.info(f"Scraped {len(articles)} articles from {source}")
-                
-                for article in articles:
-                    try:
-                        # Preprocess content (now includes lowercasing)
-                        clean_content = self.text_processor.preprocess_text(article['content'])
-                        article['content'] = clean_content
-                        
-                        # Generate summary with better error handling
-                        if clean_content and self.summarizer:
-                            try:
-                                summary = await self.summarizer.summarize_text(clean_content)
-                                article['summary'] = summary
-                            except Exception as e:
-                                logger.error(f"Error generating summary: {e}")
-                                article['summary'] = "Summary generation failed"
-                        else:
-                            article['summary'] = "No summary available"
-                        
-                        # Store in database
-                        article_id = self.db.store_article(article)
-                        article_ids.append(article_id)
-                        
-                        logger.info(f"Processed article: {article['title'][:50]}...")
-                        
-                    except Exception as e:
-                        logger.error(f"Error processing article '{article.get('title', 'Unknown')}': {e}")
-                        continue
+            session = await self.get_session()
+            scraper = WebScraper(session)
+            articles = await scraper.scrape_articles(source, limit)
+            
+            logger.info(f"Scraped {len(articles)} articles from {source}")
+            
+            processed = []
+            for article in articles:
+                try:
+                    # Preprocess content (now includes lowercasing)
+                    article['content'] = self.text_processor.preprocess_text(article['content'])
+                    processed.append(article)
+                except Exception as e:
+                    logger.error(f"Error processing article '{article.get('title', 'Unknown')}': {e}")
+                    continue
+            
+            # Summarize concurrently, bounded by the summarizer's rate limit
+            if self.summarizer:
+                semaphore = asyncio.Semaphore(self.summarizer.rate_limit_concurrent)
+                await asyncio.gather(*(self._summarize_article(article, semaphore) for article in processed))
+            else:
+                for article in processed:
+                    article['summary'] = "No summary available"
+            
+            for article in processed:
+                logger.info(f"Processed article: {article['title'][:50]}...")
+            
+            # Store the whole batch in one transaction, on a worker thread so the
+            # commit's fsync doesn't stall the event loop
+            loop = asyncio.get_running_loop()
+            article_ids = await loop.run_in_executor(None, self.db.store_articles, processed)
         except Exception as e:
             logger.error(f"Error in process_articles: {e}")
         
         return article_ids
 
 # CLI Interface
+_DB: Optional[DatabaseManager] = None
+
+def get_db() -> DatabaseManager:
+    """DatabaseManager shared by every command run in this process"""
+    global _DB
+    if _DB is None:
+        _DB = DatabaseManager()
+        atexit.register(close_db)
+    return _DB
+
+def close_db():
+    """Close the shared DatabaseManager, if one was opened"""
+    global _DB
+    if _DB is not None:
+        _DB.close()
+        _DB = None
+
 @click.group()
 def cli():
     """Article Scraper and Summarizer CLI"""
@@ -702,8 +930,15 @@ def scrape(source, limit):
     click.echo(f"Scraping {limit} articles from {source}...")
     
     try:
-        processor = ArticleProcessor()
-        article_ids = asyncio.run(processor.process_articles(source, limit))
+        processor = ArticleProcessor(get_db())
+        
+        async def run():
+            try:
+                return await processor.process_articles(source, limit)
+            finally:
+                await processor.close()
+        
+        article_ids = asyncio.run(run())
         
         click.echo(f"Successfully processed {len(article_ids)} articles")
         click.echo(f"Article IDs: {article_ids}")
@@ -721,13 +956,15 @@ def test_scrape(url):
     """Test scraping a single URL"""
     async def test():
         try:
-            async with aiohttp.ClientSession() as session:
+            async with create_session() as session:
                 scraper = UniversalWebScraper(session)
                 result = await scraper.scrape_url(url)
                 return result
         except Exception as e:
             logger.error(f"Error in test scrape: {e}")
             return None
+        finally:
+            close_parse_pool()
     
     try:
         result = asyncio.run(test())
@@ -747,8 +984,8 @@ def test_scrape(url):
 def get_summary(article_id):
     """Get summary by article ID"""
     try:
-        db = DatabaseManager()
-        article = db.get_summary_by_id(article_id)
+        db = get_db()
+        article = db.get_summary_by_id_cached(article_id, include_content=False)
         
         if article:
             click.echo(f"\nTitle: {article['title']}")
@@ -762,21 +999,68 @@ def get_summary(article_id):
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
 
+def _shown_count(db: DatabaseManager, limit: Optional[int], offset: int) -> int:
+    """How many articles a page will show, from COUNT(*) rather than fetching them"""
+    shown = max(db.count_articles() - offset, 0)
+    return shown if limit is None else min(shown, limit)
+
+# view_db layout: one format_map per article; {details} is either the full
+# content/summary block or the one-line summary preview
+_VIEW_HEADER_TMPL = "\n📊 Database Contents ({total} articles shown)\n{sep}"
+
+_VIEW_ARTICLE_TMPL = """
+🔹 Article #{id} ({index}/{total})
+Title: {title}
+Author: {author}
+Source: {source_url}
+Created: {created_at}
+{details}{rule}"""
+
+_VIEW_FULL_TMPL = """
+📝 Content:
+{content}
+
+📋 Summary:
+{summary}
+"""
+
+_VIEW_PREVIEW_TMPL = "Summary: {summary_preview}\n"
+
+def _flush_lines(lines: List[str], force: bool = False):
+    """Echo buffered output lines in one write once enough have piled up"""
+    if lines and (force or len(lines) >= 1000):
+        click.echo("\n".join(lines))
+        lines.clear()
+
+def _page_offset(limit: Optional[int], offset: int, page: Optional[int]) -> int:
+    """Row offset for --page (1-based, pages of --limit rows), else --offset"""
+    if page is None:
+        return offset
+    if limit is None:
+        raise click.UsageError("--page requires --limit")
+    return (page - 1) * limit
+
 @cli.command()
-def list_articles():
+@click.option('--limit', type=click.IntRange(min=1, max=10_000), default=None, help='Number of articles to list (default: all)')
+@click.option('--offset', type=click.IntRange(min=0), default=0, help='Number of articles to skip')
+@click.option('--page', type=click.IntRange(min=1), default=None, help='Page number, in pages of --limit articles')
+def list_articles(limit, offset, page):
     """List all articles"""
+    offset = _page_offset(limit, offset, page)
     try:
-        db = DatabaseManager()
-        articles = db.get_all_articles()
+        db = get_db()
+        total = _shown_count(db, limit, offset)
         
-        if articles:
-            click.echo(f"\nFound {len(articles)} articles:\n")
-            for article in articles:
-                click.echo(f"ID: {article['id']}")
-                click.echo(f"Title: {article['title']}")
-                click.echo(f"Author: {article['author']}")
-                click.echo(f"Created: {article['created_at']}")
-                click.echo("-" * 50)
+        if total:
+            lines = [f"\nFound {total} articles:\n"]
+            for article in db.iter_articles(limit, offset):
+                lines.append(f"ID: {article['id']}")
+                lines.append(f"Title: {article['title']}")
+                lines.append(f"Author: {article['author']}")
+                lines.append(f"Created: {article['created_at']}")
+                lines.append("-" * 50)
+                _flush_lines(lines)
+            _flush_lines(lines, force=True)
         else:
             click.echo("No articles found")
             
@@ -787,50 +1071,64 @@ def list_articles():
 def init_db():
     """Initialize the database"""
     try:
-        db = DatabaseManager()
+        db = get_db()
         click.echo("Database initialized successfully")
     except Exception as e:
         click.echo(f"Error initializing database: {e}", err=True)
 
 @cli.command()
 @click.option('--full', is_flag=True, help='Show full content and summary')
-@click.option('--limit', default=10, help='Number of articles to show')
-def view_db(full, limit):
+@click.option('--limit', type=click.IntRange(min=1, max=10_000), default=10, help='Number of articles to show')
+@click.option('--offset', type=click.IntRange(min=0), default=0, help='Number of articles to skip')
+@click.option('--page', type=click.IntRange(min=1), default=None, help='Page number, in pages of --limit articles')
+def view_db(full, limit, offset, page):
     """View database contents with detailed information"""
+    offset = _page_offset(limit, offset, page)
     try:
-        db = DatabaseManager()
-        articles = db.get_all_articles()
+        db = get_db()
+        total = _shown_count(db, limit, offset)
         
-        if not articles:
+        if not total:
             click.echo("No articles found in database")
             return
         
-        articles = articles[:limit]
+        if full:
+            # --full needs the IDs up front: one query for every shown article's
+            # content instead of one per row
+            articles = db.get_articles_page(limit, offset)
+            full_articles = db.get_summaries_by_ids([article['id'] for article in articles], content_len=500)
+        else:
+            articles = db.iter_articles(limit, offset)
+            full_articles = {}
         
-        click.echo(f"\n📊 Database Contents ({len(articles)} articles shown)")
-        click.echo("=" * 80)
+        lines = [_VIEW_HEADER_TMPL.format_map({'total': total, 'sep': "=" * 80})]
         
         for i, article in enumerate(articles, 1):
-            click.echo(f"\n🔹 Article #{article['id']} ({i}/{len(articles)})")
-            click.echo(f"Title: {article['title']}")
-            click.echo(f"Author: {article['author'] or 'Unknown'}")
-            click.echo(f"Source: {article['source_url']}")
-            click.echo(f"Created: {article['created_at']}")
-            
             if full:
-                full_article = db.get_summary_by_id(article['id'])
+                full_article = full_articles.get(article['id'])
                 if full_article:
-                    click.echo(f"\n📝 Content:")
-                    content = full_article['content'][:500] + "..." if len(full_article['content']) > 500 else full_article['content']
-                    click.echo(content)
-                    
-                    click.echo(f"\n📋 Summary:")
-                    click.echo(full_article['summary'] or 'No summary available')
+                    content = full_article['content'] + "..." if full_article['content_length'] > 500 else full_article['content']
+                    details = _VIEW_FULL_TMPL.format_map({
+                        'content': content,
+                        'summary': full_article['summary'] or 'No summary available'
+                    })
+                else:
+                    details = ""
             else:
-                summary_preview = article['summary'][:150] + "..." if article['summary'] and len(article['summary']) > 150 else article['summary'] or 'No summary'
-                click.echo(f"Summary: {summary_preview}")
+                summary_preview = article['summary_preview'][:150] + "..." if article['summary_preview'] and len(article['summary_preview']) > 150 else article['summary_preview'] or 'No summary'
+                details = _VIEW_PREVIEW_TMPL.format_map({'summary_preview': summary_preview})
             
-            click.echo("-" * 80)
+            lines.append(_VIEW_ARTICLE_TMPL.format_map({
+                **article,
+                'author': article['author'] or 'Unknown',
+                'index': i,
+                'total': total,
+                'details': details,
+                'rule': "-" * 80
+            }))
+            _flush_lines(lines)
+        
+        _flush_lines(lines, force=True)
             
     except Exception as e:
         click.echo(f"Error viewing database: {e}", err=True)
@@ -0,0 +1,115 @@
+import json
+import sqlite3
+
+import pytest
+
+from db_viewer import DatabaseViewer, load_from_json
+
+# Same table main.py's DatabaseManager creates
+ARTICLES_SCHEMA = '''
+    CREATE TABLE articles (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        title TEXT NOT NULL,
+        author TEXT,
+        content TEXT NOT NULL,
+        summary TEXT,
+        source_url TEXT NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+'''
+
+
+def _open_viewer(tmp_path, count):
+    db_path = str(tmp_path / 'articles.db')
+    conn = sqlite3.connect(db_path)
+    conn.execute(ARTICLES_SCHEMA)
+    conn.executemany(
+        "INSERT INTO articles (title, author, content, summary, source_url, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+        [(f'Title {i}', f'Author {i % 50}', f'Content {i} "quoted" \u00e9\n', f'Summary {i}' if i % 3 else None,
+          f'https://example.com/{i}', f'2024-01-{i % 28 + 1:02d} 12:00:00') for i in range(count)])
+    conn.commit()
+    conn.close()
+    return DatabaseViewer(db_path)
+
+
+@pytest.fixture
+def viewer(tmp_path):
+    with _open_viewer(tmp_path, 500) as viewer:
+        yield viewer
+
+
+def _query_plan(viewer, **search):
+    """EXPLAIN QUERY PLAN details for the statement a search runs"""
+    statements = []
+    viewer.conn.set_trace_callback(statements.append)
+    try:
+        viewer.search_articles(**search)
+    finally:
+        viewer.conn.set_trace_callback(None)
+    # The trace callback sees the statement with its parameters bound
+    return [row['detail'] for row in viewer.conn.execute('EXPLAIN QUERY PLAN ' + statements[-1])]
+
+
+@pytest.mark.parametrize('field', ['title', 'author'])
+@pytest.mark.parametrize('mode, query', [('prefix', 'title 1'), ('exact', 'Author 7')])
+def test_column_search_uses_nocase_index(viewer, field, mode, query):
+    plan = _query_plan(viewer, query=query, field=field, mode=mode)
+
+    assert any(detail.startswith(f'SEARCH articles USING INDEX idx_articles_{field}_nocase')
+               for detail in plan), plan
+    assert not any(detail.startswith('SCAN articles') for detail in plan), plan
+
+
+def test_column_search_results(viewer):
+    rows, next_cursor = viewer.search_articles('title 49', field='title', mode='prefix')
+    assert {row['title'] for row in rows} == {'Title 49'} | {f'Title 49{i}' for i in range(10)}
+    assert next_cursor is None
+
+    rows, _ = viewer.search_articles('author 7', field='author', mode='exact')
+    assert len(rows) == 10
+    assert all(row['author'] == 'Author 7' for row in rows)
+
+
+@pytest.mark.parametrize('count', [0, 1, 2500])
+def test_export_is_valid_json(tmp_path, count):
+    with _open_viewer(tmp_path, count) as viewer:
+        filename = viewer.export_to_json(str(tmp_path / 'export.json'))
+        articles = list(viewer.get_all_articles_detailed())
+        with open(filename, 'rb') as f:
+            data = json.loads(f.read())
+
+        assert list(data) == ['export_date', 'table_info', 'analysis', 'articles']
+        assert data['table_info'] == viewer.get_table_info()
+        assert data['articles'] == articles
+        assert load_from_json(filename) == data
+
+
+def test_compressed_export_round_trips(tmp_path):
+    pytest.importorskip('zstandard')
+    with _open_viewer(tmp_path, 2500) as viewer:
+        filename = viewer.export_to_json(str(tmp_path / 'export.json'), compress=True)
+        assert filename.endswith('.json.zst')
+        assert load_from_json(filename)['articles'] == list(viewer.get_all_articles_detailed())
+
+
+def test_failed_export_leaves_no_file(tmp_path, monkeypatch):
+    with _open_viewer(tmp_path, 10) as viewer:
+        def locked():
+            raise sqlite3.OperationalError('database is locked')
+        monkeypatch.setattr(viewer, '_iter_article_rows', locked)
+
+        with pytest.raises(sqlite3.OperationalError):
+            viewer.export_to_json(str(tmp_path / 'export.json'))
+        assert not (tmp_path / 'export.json').exists()
+
+
+def test_interrupted_export_is_removed(tmp_path, monkeypatch):
+    with _open_viewer(tmp_path, 10) as viewer:
+        def interrupted(f, *args):
+            f.write(b'{\n')
+            raise KeyboardInterrupt
+        monkeypatch.setattr(viewer, '_write_export', interrupted)
+
+        with pytest.raises(KeyboardInterrupt):
+            viewer.export_to_json(str(tmp_path / 'export.json'))
+        assert not (tmp_path / 'export.json').exists()
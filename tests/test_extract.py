@@ -0,0 +1,63 @@
+import pytest
+
+from extractor import parse_html
+
+URL = 'https://news.example.com/a'
+LONG = 'The committee met on Tuesday to review the proposal in detail. '
+
+# (html, expected (title, author, content)); the expected values are what the
+# original BeautifulSoup extractors returned for the same pages
+CASES = {
+    'script_tail': (
+        f'<html><head><title>Council approves budget</title></head><body>'
+        f'<article>{LONG}Hello<script>track()</script>World</article></body></html>',
+        ('Council approves budget', 'Unknown',
+         'The committee met on Tuesday to review the proposal in detail. Hello World'),
+    ),
+    'aside_tail': (
+        f'<html><body><h1>Budget vote</h1>'
+        f'<div class="post-content">{LONG}Hello<aside>Advertisement</aside>World</div></body></html>',
+        ('Budget vote', 'Unknown',
+         'Budget vote The committee met on Tuesday to review the proposal in detail. Hello World'),
+    ),
+    'template_rt': (
+        f'<html><body><h1>Ruby <ruby>漢<rt>kan</rt><rp>(</rp></ruby> text</h1>'
+        f'<article>{LONG}Before<template><p>hidden</p></template>After <ruby>字<rt>ji</rt></ruby> end</article>'
+        f'</body></html>',
+        ('Ruby 漢 text', 'Unknown',
+         'Ruby 漢 text The committee met on Tuesday to review the proposal in detail. Before After 字 end'),
+    ),
+    'comments': (
+        f'<html><body><h1>Title<!-- draft --> here</h1>'
+        f'<article>{LONG}One<!-- note -->Two <b>bold</b><!-- x -->tail</article></body></html>',
+        ('Title here', 'Unknown',
+         'Title here The committee met on Tuesday to review the proposal in detail. One Two bold tail'),
+    ),
+    'meta_author': (
+        f'<html><head><meta property="og:title" content="Open Graph Title">'
+        f'<meta name="author" content="Jane Reporter"></head><body><main>{LONG}</main></body></html>',
+        ('Open Graph Title', 'Jane Reporter',
+         'The committee met on Tuesday to review the proposal in detail.'),
+    ),
+    'byline_author': (
+        f'<html><body><h2>Second level title</h2><span class="byline">By John Smith</span>'
+        f'<nav>Home News</nav><p>{LONG}</p><p>Second paragraph with <a href="#">a link</a> inside.</p>'
+        f'</body></html>',
+        ('Second level title', 'By John Smith',
+         'Second level title By John Smith The committee met on Tuesday to review the proposal in detail. '
+         'Second paragraph with a link inside.'),
+    ),
+    'fallback_title': (
+        f'<html><body><div class="author">x</div><a rel="author">Ann Writer</a><p>{LONG}</p>'
+        f'<footer>Footer text</footer></body></html>',
+        ('Article from news.example.com', 'Ann Writer',
+         'x Ann Writer The committee met on Tuesday to review the proposal in detail.'),
+    ),
+}
+
+
+@pytest.mark.parametrize('html, expected', CASES.values(), ids=CASES.keys())
+def test_extract_matches_original_extractors(html, expected):
+    article = parse_html(html.encode(), URL)
+    assert (article['title'], article['author'], article['content']) == expected
+    assert article['source_url'] == URL
@@ -0,0 +1,74 @@
+import asyncio
+import os
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+import main
+from extractor import parse_html
+
+BIG_PAGE = ('<html><body><article>' + '<p>Paragraph text for the pooled parse. </p>' * 4000
+            + '</article></body></html>').encode()
+
+
+def test_parse_pool_is_replaced_after_a_worker_dies():
+    async def parse():
+        return await main._parse_page(BIG_PAGE, 'https://news.example.com/a', 'utf-8')
+
+    try:
+        assert len(BIG_PAGE) >= main._INLINE_PARSE_BYTES
+        broken = main._get_parse_pool()
+        with pytest.raises(BrokenProcessPool):
+            broken.submit(os._exit, 1).result()
+
+        with pytest.raises(BrokenProcessPool):
+            asyncio.run(parse())
+        assert main._PARSE_POOL is None
+
+        article = asyncio.run(parse())
+        assert article['content'].startswith('Paragraph text for the pooled parse.')
+        assert main._PARSE_POOL is not broken
+    finally:
+        main.close_parse_pool()
+
+
+class _Response:
+    """The parts of aiohttp.ClientResponse that _read_body uses"""
+
+    def __init__(self, body, charset=None):
+        self._body = body
+        self.charset = charset
+
+    async def read(self):
+        return self._body
+
+
+@pytest.mark.parametrize('charset, body, expected', [
+    ('utf8mb4', b'<p>caf\xc3\xa9</p>', 'utf-8'),
+    ('x-user-defined', b'<meta charset="windows-1252"><p>caf\xe9</p>', 'windows-1252'),
+    (None, b'<meta charset="no-such-charset"><p>caf\xc3\xa9</p>', 'utf-8'),
+    ('base64', b'<p>caf\xc3\xa9</p>', 'utf-8'),
+    ('ISO-8859-1', b'<p>caf\xe9</p>', 'ISO-8859-1'),
+])
+def test_read_body_skips_unknown_charsets(charset, body, expected):
+    html, encoding = asyncio.run(main.UniversalWebScraper._read_body(_Response(body, charset)))
+    assert html == body
+    assert encoding == expected
+
+
+def test_parse_html_reads_encodings_libxml2_lacks_as_utf8():
+    html = '<html><body><article>{}</article></body></html>'.format('Café au lait. ' * 20)
+    article = parse_html(html.encode('utf-8'), 'https://news.example.com/a', 'mac-roman')
+    assert article['content'].startswith('Café au lait.')
+
+
+def test_ttl_cache_overwrite_keeps_other_entries():
+    cache = main.TTLCache(ttl=60, maxsize=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.set('a', 3)
+    assert (cache.get('a'), cache.get('b')) == (3, 2)
+
+    # 'b' is now the oldest entry, so adding a new key evicts it
+    cache.set('c', 4)
+    assert (cache.get('a'), cache.get('b'), cache.get('c')) == (3, None, 4)